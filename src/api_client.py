@@ -0,0 +1,281 @@
+import email.utils
+import logging
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class APIError(RuntimeError):
+    """Raised when an upstream API cannot be reached in time."""
+
+
+class CircuitOpenError(APIError):
+    """Raised without calling the host while its circuit breaker is open."""
+
+
+# ---------------------------------------------------
+# Token Bucket Class
+# ---------------------------------------------------
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` requests per second, bursts up to ``capacity``.
+
+    ``pause(seconds)`` empties the bucket until then, so a Retry-After from
+    the host holds back every caller, not just the one that got the 429.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _wait_time(self) -> float:
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Take one token, waiting up to ``timeout`` seconds. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                wait = self._wait_time()
+            if wait == 0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+
+# ---------------------------------------------------
+# Circuit Breaker Class
+# ---------------------------------------------------
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures.
+
+    While open, calls fail fast for ``reset_timeout`` seconds. After that a
+    single trial call is let through (half-open): success closes the circuit,
+    failure opens it again.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.failures < self.failure_threshold:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# ---------------------------------------------------
+# API Client Class
+# ---------------------------------------------------
+class APIClient:
+    """Pooled HTTP client with per-host rate limiting, retries and circuit breaking.
+
+    Each host gets its own ``TokenBucket`` and ``CircuitBreaker``. Failed
+    attempts (connection errors, timeouts, 429 and 5xx) are retried with
+    full-jitter exponential backoff, honouring Retry-After on 429. Every
+    attempt uses ``timeout`` and the whole call, waits included, is bounded
+    by ``deadline`` seconds. When retries run out on an HTTP error status
+    the last response is returned, so callers decide how to handle it.
+    """
+
+    def __init__(self, rate: float = 5, burst: float = 5, max_retries: int = 3,
+                 backoff: float = 0.5, max_backoff: float = 8, timeout: Timeout = (3.05, 15),
+                 deadline: float = 30, failure_threshold: int = 5, reset_timeout: float = 30,
+                 max_connections: int = 4, session: Optional[requests.Session] = None):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.deadline = deadline
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.session = session or requests.Session()
+        if session is None:
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_connections)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._breakers[host]
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        host = urlsplit(url).netloc
+        bucket, breaker = self.bucket(host), self.breaker(host)
+        kwargs.setdefault("timeout", self.timeout)
+        deadline = time.monotonic() + self.deadline
+
+        for attempt in range(self.max_retries + 1):
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {host}; not calling it for now")
+            if not bucket.acquire(timeout=deadline - time.monotonic()):
+                raise APIError(f"Rate limit for {host} leaves no time before the deadline")
+
+            retry_after = None
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                breaker.record_failure()
+                error, response = e, None
+                logger.warning("%s %s failed (attempt %d): %s", method, host, attempt + 1, e)
+            except Exception:
+                # Not worth retrying (e.g. an invalid URL), but a half-open
+                # trial must still record its outcome or the host stays blocked
+                breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return response
+                if response.status_code == 429:
+                    # Quota, not an outage: back off without tripping the breaker
+                    breaker.record_success()
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    if retry_after is not None:
+                        bucket.pause(retry_after)
+                else:
+                    breaker.record_failure()
+                error = None
+                logger.warning("%s %s returned %d (attempt %d)", method, host, response.status_code, attempt + 1)
+
+            delay = retry_after if retry_after is not None else self._backoff_delay(attempt)
+            if attempt == self.max_retries or time.monotonic() + delay > deadline:
+                break
+            time.sleep(delay)
+
+        if response is not None:
+            return response
+        raise APIError(f"{method} {host} failed after {attempt + 1} attempts") from error
+
+    def stats(self) -> Dict[str, Dict]:
+        """Breaker state and consecutive failures per host."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {host: {"state": b.state, "failures": b.failures} for host, b in breakers.items()}
+
+
+# One client per process, shared by the news and stocks modules
+default_client = APIClient()
+
+
+if __name__ == "__main__":
+    # Self-check against a local stub server: two 429s, then a 200
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    calls = []
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            calls.append(time.monotonic())
+            status = 429 if len(calls) <= 2 else 200
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", "0.2")
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(json.dumps({"calls": len(calls)}).encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    client = APIClient(rate=10, burst=1, timeout=2, deadline=5)
+    started = time.monotonic()
+    response = client.get(f"http://127.0.0.1:{server.server_port}/")
+    print(f"Status {response.status_code} after {len(calls)} calls in {time.monotonic() - started:.2f}s")
+    print(client.stats())
+    server.shutdown()
@@ -0,0 +1,136 @@
+"""Headless batch screener for cron / server use.
+
+Runs StockScreener over a ticker file or the packaged S&P 500 universe on a
+process pool and writes the results (and optionally every ticker's indicator
+frame) to Parquet or CSV.
+
+Examples:
+    python src/batch_screener.py --universe --output results.parquet
+    python src/batch_screener.py --tickers-file tickers.txt --output results.csv --frames-dir frames/
+"""
+import argparse
+import os
+import sys
+import time
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from screener import StockScreener, get_default_store, load_universe
+
+
+def read_tickers(path: str) -> List[str]:
+    """Read tickers from a file (comma- or whitespace-separated, '#' comments allowed)."""
+    tickers = []
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0]
+            tickers.extend(t.strip().upper() for t in line.replace(",", " ").split() if t.strip())
+    return list(dict.fromkeys(tickers))
+
+
+def screen_chunk(tickers: List[str], start: datetime, end: datetime, threads: int,
+                 keep_frames: bool) -> Tuple[List[Dict], Dict[str, str], Dict[str, pd.DataFrame]]:
+    """Screen one chunk of tickers (runs inside a worker process)."""
+    screener = StockScreener(tickers, start, end, max_workers=threads)
+    screener.run()
+    frames = screener.indicator_data if keep_frames else {}
+    return screener.results, screener.errors, frames
+
+
+def write_frame(df: pd.DataFrame, path: str, index: bool = False) -> None:
+    """Write a DataFrame as Parquet or CSV depending on the file extension."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if path.endswith(".parquet"):
+        try:
+            df.to_parquet(path, index=index)
+        except ImportError as e:
+            raise SystemExit(
+                "Writing Parquet requires 'pyarrow' (pip install pyarrow), or use a .csv output. "
+                f"Original error: {e}"
+            )
+    elif path.endswith(".csv"):
+        df.to_csv(path, index=index)
+    else:
+        raise SystemExit(f"Unsupported output format for {path!r}; use .parquet or .csv")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the stock screener without the web UI.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--tickers-file", help="file with tickers (comma/whitespace separated)")
+    source.add_argument("--universe", action="store_true", help="screen the packaged S&P 500 list")
+    parser.add_argument("--start", type=lambda s: datetime.strptime(s, "%Y-%m-%d"),
+                        default=datetime.today() - timedelta(days=365), help="start date (YYYY-MM-DD)")
+    parser.add_argument("--end", type=lambda s: datetime.strptime(s, "%Y-%m-%d"),
+                        default=datetime.today(), help="end date (YYYY-MM-DD)")
+    parser.add_argument("--output", required=True, help="results file (.parquet or .csv)")
+    parser.add_argument("--frames-dir", help="also write each ticker's indicator frame here")
+    parser.add_argument("--frames-format", choices=["parquet", "csv"],
+                        help="format for --frames-dir (default: same as --output)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--threads", type=int, default=8, help="download threads per process")
+    parser.add_argument("--chunk-size", type=int, default=50, help="tickers per worker task")
+    parser.add_argument("--top-n", type=int, help="only keep the top N results by score")
+    parser.add_argument("--rank-by", default="Score", help="indicator used to rank after Score")
+    parser.add_argument("--clear-store", action="store_true",
+                        help="delete the on-disk price history before screening")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    tickers = load_universe() if args.universe else read_tickers(args.tickers_file)
+    if not tickers:
+        print("No tickers to screen.", file=sys.stderr)
+        return 1
+
+    if args.clear_store:
+        get_default_store().clear()
+
+    keep_frames = args.frames_dir is not None
+    chunks = [tickers[i:i + args.chunk_size] for i in range(0, len(tickers), args.chunk_size)]
+    results, errors, frames = [], {}, {}
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max(1, min(args.processes, len(chunks)))) as pool:
+        futures = [
+            pool.submit(screen_chunk, chunk, args.start, args.end, args.threads, keep_frames)
+            for chunk in chunks
+        ]
+        for done, future in enumerate(as_completed(futures), start=1):
+            chunk_results, chunk_errors, chunk_frames = future.result()
+            results.extend(chunk_results)
+            errors.update(chunk_errors)
+            frames.update(chunk_frames)
+            print(f"[{done}/{len(chunks)}] {len(results)} screened, {len(errors)} failed", file=sys.stderr)
+    screen_time = time.perf_counter() - started
+
+    if args.top_n:
+        results_df = StockScreener.rank_results(results, args.top_n, args.rank_by)
+    else:
+        order = {ticker: i for i, ticker in enumerate(tickers)}
+        results_df = pd.DataFrame(results)
+        if not results_df.empty:
+            results_df = results_df.sort_values("Ticker", key=lambda s: s.map(order)).reset_index(drop=True)
+    write_frame(results_df, args.output)
+
+    if keep_frames:
+        extension = args.frames_format or ("csv" if args.output.endswith(".csv") else "parquet")
+        for ticker, df in frames.items():
+            write_frame(df, os.path.join(args.frames_dir, f"{ticker}.{extension}"), index=True)
+
+    total_time = time.perf_counter() - started
+    print(f"Screened {len(tickers)} tickers: {len(results)} ok, {len(errors)} failed")
+    for ticker, error in sorted(errors.items()):
+        print(f"  {ticker}: {error}")
+    print(f"Screening: {screen_time:.2f}s ({screen_time / len(tickers) * 1000:.1f} ms/ticker), "
+          f"total: {total_time:.2f}s, processes: {args.processes}")
+    print(f"Results written to {args.output}")
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
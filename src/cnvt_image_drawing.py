@@ -6,27 +6,150 @@ except Exception as e:
         f"Original error: {e}"
     )
 import numpy as np
+import hashlib
 import io
-from typing import Optional
+import multiprocessing
+import os
+import struct
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import BinaryIO, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
+DEFAULT_TILE_SIZE = 1024
+# Rough working-set estimates per pixel, used for the max_memory_mb ceiling
+FRAME_BYTES_PER_PIXEL = 6  # gray + filtered + threshold + cleaned + mask + output
+TILE_BYTES_PER_PIXEL = 4  # per-tile filter/threshold/morphology temporaries
+# BGR decode buffer + gray copy while decoding; later gray input, stitched result and contour mask
+RESIDENT_BYTES_PER_PIXEL = 4
 
-def convert_image_bytes(
-    image_bytes: bytes,
-    blur_ksize: int = 9,
-    sigma_color: int = 75,
-    sigma_space: int = 75,
-    min_area: int = 100,
-) -> bytes:
-    """Convert input image bytes to a clean outline PNG and return PNG bytes.
 
-    Args:
-        image_bytes: raw bytes of the input image (any format readable by OpenCV)
-        blur_ksize: kernel "d" parameter for bilateralFilter (odd integer >=1). Will be coerced to odd.
-        min_area: minimum contour area to keep; smaller contours will be removed.
+# ---------------------------------------------------
+# Stage Cache
+# ---------------------------------------------------
+class StageCache:
+    """Thread-safe LRU of pipeline stage results, bounded by total bytes.
 
-    Returns:
-        PNG image bytes of the processed outline image.
+    Keys are (stage, content hash, stage parameters...), so changing a late
+    parameter such as ``min_area`` reuses the decoded and filtered images.
+    Cached arrays are made read-only because they are shared between callers.
     """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Union[np.ndarray, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _size(value) -> int:
+        return value.nbytes if isinstance(value, np.ndarray) else len(value)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Union[np.ndarray, bytes]]):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+        size = self._size(value)
+        if size > self.max_bytes:
+            return value
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = value
+                self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= self._size(evicted)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.nbytes, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses}
+
+
+# Shared by every session in the process (used by the Image Convert page)
+stage_cache = StageCache()
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _stage(cache: Optional[StageCache], key: Hashable, compute: Callable):
+    return compute() if cache is None else cache.get_or_compute(key, compute)
+
+
+def _halo(blur_ksize: int) -> int:
+    """Overlap needed so tiles match the full frame: bilateral radius + threshold block + morphology."""
+    return blur_ksize // 2 + 8
+
+
+def _image_shape(data: bytes) -> Optional[Tuple[int, int]]:
+    """(height, width) from a PNG, JPEG, BMP or TIFF header, without decoding; None if unknown."""
+    try:
+        if data[:8] == b"\x89PNG\r\n\x1a\n" and data[12:16] == b"IHDR":
+            width, height = struct.unpack(">II", data[16:24])
+            return height, width
+
+        if data[:2] == b"BM":
+            if struct.unpack("<I", data[14:18])[0] == 12:  # OS/2 header
+                width, height = struct.unpack("<HH", data[18:22])
+            else:
+                width, height = struct.unpack("<ii", data[18:26])
+            return abs(height), width
+
+        if data[:2] == b"\xff\xd8":
+            i = 2
+            while i + 9 <= len(data):
+                if data[i] != 0xFF:
+                    return None
+                marker = data[i + 1]
+                if marker == 0xFF:  # fill byte
+                    i += 1
+                    continue
+                if marker == 0x01 or 0xD0 <= marker <= 0xD8:  # markers without a length
+                    i += 2
+                    continue
+                # Start-of-frame markers (C4, C8 and CC are tables, not frames)
+                if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                    height, width = struct.unpack(">HH", data[i + 5:i + 9])
+                    return height, width
+                i += 2 + struct.unpack(">H", data[i + 2:i + 4])[0]
+            return None
+
+        if data[:4] in (b"II*\0", b"MM\0*"):
+            order = "<" if data[:2] == b"II" else ">"
+            ifd = struct.unpack(order + "I", data[4:8])[0]
+            size = {}
+            for n in range(struct.unpack(order + "H", data[ifd:ifd + 2])[0]):
+                entry = data[ifd + 2 + 12 * n:ifd + 14 + 12 * n]
+                tag, kind = struct.unpack(order + "HH", entry[:4])
+                if tag in (256, 257):  # ImageWidth, ImageLength as SHORT or LONG
+                    size[tag] = struct.unpack(order + ("H" if kind == 3 else "I"), entry[8:10 if kind == 3 else 12])[0]
+            if len(size) == 2:
+                return size[257], size[256]
+    except struct.error:  # truncated header
+        return None
+    return None
+
+
+def _decode_gray(image_bytes: bytes) -> np.ndarray:
     # Convert bytes to numpy array for OpenCV
     nparr = np.frombuffer(image_bytes, np.uint8)
     image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
@@ -34,14 +157,11 @@ def convert_image_bytes(
         raise ValueError("Could not decode image bytes")
 
     # Convert to grayscale
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
 
-    # Ensure blur_ksize is at least 1 and odd
-    if blur_ksize <= 0:
-        blur_ksize = 1
-    if blur_ksize % 2 == 0:
-        blur_ksize += 1
 
+def _preprocess(gray: np.ndarray, blur_ksize: int, sigma_color: int, sigma_space: int) -> np.ndarray:
+    """Bilateral filter, adaptive threshold and morphological opening of a gray image."""
     # Apply Gaussian blur first, then bilateral filter to preserve edges while reducing noise
     #blurred = cv2.GaussianBlur(gray, (blur_ksize, blur_ksize), 0)
     # Use provided sigma_color and sigma_space for bilateral filtering
@@ -58,40 +178,299 @@ def convert_image_bytes(
 
     # Optional: Morphological operations to clean up noise
     kernel = np.ones((2, 2), np.uint8)
-    cleaned = cv2.morphologyEx(adaptive_thresh, cv2.MORPH_OPEN, kernel)
+    return cv2.morphologyEx(adaptive_thresh, cv2.MORPH_OPEN, kernel)
+
+
+def _tile_edges(length: int, tile_size: int, min_last: int) -> List[int]:
+    edges = list(range(0, length, tile_size)) + [length]
+    # OpenCV filters a strip only a few pixels wide differently from the same
+    # pixels in a larger image, so a narrow remainder joins its neighbour
+    if len(edges) > 2 and edges[-1] - edges[-2] < min_last:
+        del edges[-2]
+    return edges
+
+
+def _tiles(height: int, width: int, tile_size: int, min_last: int = 0) -> List[Tuple[int, int, int, int]]:
+    """(y0, y1, x0, x1) tile cores; the last row/column is at least ``min_last`` wide."""
+    rows, columns = _tile_edges(height, tile_size, min_last), _tile_edges(width, tile_size, min_last)
+    return [(y0, y1, x0, x1) for y0, y1 in zip(rows, rows[1:]) for x0, x1 in zip(columns, columns[1:])]
+
+
+def _preprocess_tiled(gray: np.ndarray, blur_ksize: int, sigma_color: int, sigma_space: int,
+                      tile_size: int, workers: int) -> np.ndarray:
+    """``_preprocess`` over overlapping tiles in parallel, stitched without seams.
 
+    Each tile is processed with a halo wider than the combined filter radius
+    and only its core is copied back, so the result equals the full-frame
+    one. A last row or column of tiles narrower than two halos is merged into
+    its neighbour. OpenCV releases the GIL, so threads use several cores.
+    """
+    height, width = gray.shape
+    halo = _halo(blur_ksize)
+    result = np.empty_like(gray)
+
+    def run(tile):
+        y0, y1, x0, x1 = tile
+        top, left = max(0, y0 - halo), max(0, x0 - halo)
+        out = _preprocess(gray[top:min(height, y1 + halo), left:min(width, x1 + halo)],
+                          blur_ksize, sigma_color, sigma_space)
+        result[y0:y1, x0:x1] = out[y0 - top:y1 - top, x0 - left:x1 - left]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(run, _tiles(height, width, tile_size, min_last=2 * halo)))
+    return result
+
+
+def _filter_contours(cleaned: np.ndarray, min_area: int) -> np.ndarray:
+    """Mask with only the external contours of at least ``min_area`` filled in."""
     # Remove small contours (background noise) using min_area threshold
     contours, _ = cv2.findContours(cleaned.copy(), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     mask = np.zeros_like(cleaned)
     for contour in contours:
         if cv2.contourArea(contour) >= min_area:
             cv2.drawContours(mask, [contour], -1, 255, thickness=cv2.FILLED)
+    return mask
 
-    # Invert the edges for a sketch effect
-    inverted_edges = cv2.bitwise_not(mask)
 
-    # Encode the result to PNG bytes
-    success, png = cv2.imencode('.png', inverted_edges)
-    if not success:
-        raise RuntimeError('Failed to encode output image')
+def _plan_tiling(shape: Tuple[int, int], blur_ksize: int, tile_size: Optional[int],
+                 workers: Optional[int], max_memory_mb: Optional[float]) -> Tuple[Optional[int], int]:
+    """Pick (tile_size or None for full frame, workers) that fit ``max_memory_mb``."""
+    pixels = shape[0] * shape[1]
+    workers = max(1, workers or os.cpu_count() or 1)
+    if max_memory_mb is None:
+        return tile_size, workers
 
-    return png.tobytes()
+    budget = max_memory_mb * 1024 * 1024
+    if tile_size is None and pixels * FRAME_BYTES_PER_PIXEL <= budget:
+        return None, workers
 
+    resident = pixels * RESIDENT_BYTES_PER_PIXEL
+    if resident >= budget:
+        raise MemoryError(
+            f"A {shape[1]}x{shape[0]} image needs about {resident / 2**20:.0f} MB, "
+            f"over the {max_memory_mb:g} MB limit"
+        )
+    tile_size = tile_size or DEFAULT_TILE_SIZE
+    halo = _halo(blur_ksize)
+    # Shrink tiles until at least one in-flight tile fits next to the resident buffers
+    while True:
+        fit = int((budget - resident) // ((tile_size + 2 * halo) ** 2 * TILE_BYTES_PER_PIXEL))
+        if fit >= 1 or tile_size <= 128:
+            return tile_size, max(1, min(workers, fit))
+        tile_size //= 2
 
-if __name__ == '__main__':
-    # Quick local test when run directly: read sample file and write output
-    import sys
-    if len(sys.argv) > 1:
-        in_path = sys.argv[1]
+
+def convert_image_bytes(
+    image_bytes: bytes,
+    blur_ksize: int = 9,
+    sigma_color: int = 75,
+    sigma_space: int = 75,
+    min_area: int = 100,
+    tile_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    max_memory_mb: Optional[float] = None,
+    cache: Optional[StageCache] = None,
+) -> bytes:
+    """Convert input image bytes to a clean outline PNG and return PNG bytes.
+
+    Args:
+        image_bytes: raw bytes of the input image (any format readable by OpenCV)
+        blur_ksize: kernel "d" parameter for bilateralFilter (odd integer >=1). Will be coerced to odd.
+        min_area: minimum contour area to keep; smaller contours will be removed.
+        tile_size: process the image in overlapping tiles of this size, in parallel.
+            The output is identical to full-frame processing.
+        workers: threads used for tiles (default: number of CPUs).
+        max_memory_mb: approximate working-memory ceiling. Large images switch to
+            tiling (and fewer workers) to stay under it; raises MemoryError if
+            the image cannot fit at all. PNG, JPEG, BMP and TIFF sizes are read
+            from the header, so such images are rejected before decoding.
+        cache: optional ``StageCache``; each stage is looked up by a content hash
+            of ``image_bytes`` plus the parameters it depends on.
+
+    Returns:
+        PNG image bytes of the processed outline image.
+    """
+    # Ensure blur_ksize is at least 1 and odd
+    if blur_ksize <= 0:
+        blur_ksize = 1
+    if blur_ksize % 2 == 0:
+        blur_ksize += 1
+
+    digest = content_hash(image_bytes) if cache is not None else None
+    filter_params = (blur_ksize, sigma_color, sigma_space)
+
+    def preprocess():
+        # Plan from the header, so an image over max_memory_mb is rejected before it is decoded
+        shape = _image_shape(image_bytes)
+        if shape is not None:
+            tiles, n_workers = _plan_tiling(shape, blur_ksize, tile_size, workers, max_memory_mb)
+        gray = _stage(cache, ("gray", digest), lambda: _decode_gray(image_bytes))
+        if shape is None:
+            tiles, n_workers = _plan_tiling(gray.shape, blur_ksize, tile_size, workers, max_memory_mb)
+        if tiles is None:
+            return _preprocess(gray, blur_ksize, sigma_color, sigma_space)
+        return _preprocess_tiled(gray, blur_ksize, sigma_color, sigma_space, tiles, n_workers)
+
+    def outline():
+        # Tiling does not change the result, so it is not part of the keys
+        cleaned = _stage(cache, ("cleaned", digest, *filter_params), preprocess)
+
+        # Contours can span tiles, so they are always filtered on the stitched image
+        mask = _filter_contours(cleaned, min_area)
+
+        # Invert the edges for a sketch effect
+        inverted_edges = cv2.bitwise_not(mask)
+
+        # Encode the result to PNG bytes
+        success, png = cv2.imencode('.png', inverted_edges)
+        if not success:
+            raise RuntimeError('Failed to encode output image')
+        return png.tobytes()
+
+    return _stage(cache, ("png", digest, *filter_params, min_area), outline)
+
+
+# ---------------------------------------------------
+# Batch Conversion
+# ---------------------------------------------------
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff")
+
+
+def outline_name(name: str) -> str:
+    """Output name for an input image: ``dir/photo.jpg`` -> ``dir/photo_outline.png``."""
+    return f"{os.path.splitext(name)[0]}_outline.png"
+
+
+def list_batch_inputs(source: str) -> List[str]:
+    """Image names in a directory (relative paths) or ZIP archive, sorted."""
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            names = [info.filename for info in archive.infolist() if not info.is_dir()]
+    elif os.path.isdir(source):
+        names = [os.path.relpath(os.path.join(root, f), source).replace(os.sep, "/")
+                 for root, _, files in os.walk(source) for f in files]
     else:
-        in_path = r'C:\Users\Indugu Rao\Downloads\blacknwhiteAishini.jpg'
+        raise ValueError(f"{source} is neither a directory nor a ZIP archive")
+    return sorted(n for n in names if n.lower().endswith(IMAGE_EXTENSIONS) and "__MACOSX" not in n)
+
+
+def _read_input(source: str, name: str) -> bytes:
+    if os.path.isdir(source):
+        with open(os.path.join(source, name), "rb") as f:
+            return f.read()
+    with zipfile.ZipFile(source) as archive:
+        return archive.read(name)
+
 
-    with open(in_path, 'rb') as f:
-        out_bytes = convert_image_bytes(f.read())
+def _convert_batch_item(source: str, name: str, params: Dict) -> Dict:
+    """Convert one batch entry (runs in a worker process; reads its own input)."""
+    started = time.perf_counter()
+    result = {"name": name, "output": outline_name(name), "png": None, "error": None, "input_bytes": 0}
+    try:
+        image_bytes = _read_input(source, name)
+        result["input_bytes"] = len(image_bytes)
+        result["png"] = convert_image_bytes(image_bytes, **params)
+    except Exception as e:
+        result["error"] = str(e)
+    result["seconds"] = time.perf_counter() - started
+    return result
 
-    out_path = '..\\output\\clean_outline.png'
-    with open(out_path, 'wb') as f:
-        f.write(out_bytes)
-    print(f'Wrote {out_path}')
 
+def convert_batch(source: str, output: Union[str, BinaryIO], processes: Optional[int] = None,
+                  on_result: Optional[Callable[[Dict], None]] = None, **params) -> List[Dict]:
+    """Convert every image in a directory or ZIP into a ZIP of outline PNGs.
 
+    Images are converted on a process pool; each worker reads its own input,
+    and at most two images per process are in flight. Workers are spawned,
+    not forked: the Streamlit server calling this holds locks in other
+    threads that a forked child could never release. Every result is
+    written to the ``output`` ZIP as soon as it finishes, so neither the
+    inputs nor the archive are held in memory. ``params`` are passed to
+    ``convert_image_bytes``. Returns one report row per image (also passed
+    to ``on_result`` as it completes): File, Output, Status, Seconds,
+    Input KB and Output KB.
+    """
+    names = list_batch_inputs(source)
+    processes = processes or os.cpu_count() or 1
+    report = []
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED) as archive, \
+            ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")) as executor:
+        pending, queue = set(), iter(names)
+        while True:
+            for name in queue:
+                pending.add(executor.submit(_convert_batch_item, source, name, params))
+                if len(pending) >= 2 * processes:
+                    break
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result["png"] is not None:
+                    # PNG is already compressed, so entries are stored as-is
+                    archive.writestr(result["output"], result["png"])
+                row = {
+                    "File": result["name"],
+                    "Output": result["output"] if result["png"] is not None else "",
+                    "Status": "ok" if result["error"] is None else f"error: {result['error']}",
+                    "Seconds": round(result["seconds"], 3),
+                    "Input KB": round(result["input_bytes"] / 1024, 1),
+                    "Output KB": round(len(result["png"] or b"") / 1024, 1),
+                }
+                report.append(row)
+                if on_result is not None:
+                    on_result(row)
+    return report
+
+
+def parse_args(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Convert an image, a directory of images or a ZIP of images to outline sketches."
+    )
+    parser.add_argument("input", help="Image file, directory or .zip archive")
+    parser.add_argument("-o", "--output",
+                        help="Output PNG (single image) or ZIP (batch); defaults to next to the input")
+    parser.add_argument("--processes", type=int, default=None, help="Worker processes for batches (default: CPUs)")
+    parser.add_argument("--blur-ksize", type=int, default=9)
+    parser.add_argument("--sigma-color", type=int, default=75)
+    parser.add_argument("--sigma-space", type=int, default=75)
+    parser.add_argument("--min-area", type=int, default=100)
+    parser.add_argument("--tile-size", type=int, default=None)
+    parser.add_argument("--max-memory-mb", type=float, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    params = {
+        "blur_ksize": args.blur_ksize, "sigma_color": args.sigma_color, "sigma_space": args.sigma_space,
+        "min_area": args.min_area, "tile_size": args.tile_size,
+        "max_memory_mb": args.max_memory_mb,
+    }
+
+    if os.path.isfile(args.input) and not zipfile.is_zipfile(args.input):
+        out_path = args.output or outline_name(args.input)
+        with open(args.input, "rb") as f:
+            out_bytes = convert_image_bytes(f.read(), **params)
+        with open(out_path, "wb") as f:
+            f.write(out_bytes)
+        print(f"Wrote {out_path}")
+        return
+
+    out_path = args.output or f"{os.path.splitext(os.path.normpath(args.input))[0]}_outlines.zip"
+    started = time.perf_counter()
+    report = convert_batch(
+        args.input, out_path, processes=args.processes,
+        on_result=lambda row: print(f"{row['Seconds']:8.3f}s  {row['Status']:<6}  {row['File']}", flush=True),
+        **params
+    )
+    elapsed = time.perf_counter() - started
+    converted = sum(row["Status"] == "ok" for row in report)
+    cpu_seconds = sum(row["Seconds"] for row in report)
+    print(f"Wrote {out_path}: {converted}/{len(report)} images in {elapsed:.2f}s "
+          f"({cpu_seconds:.2f}s of conversion time, {cpu_seconds / max(elapsed, 1e-9):.1f}x parallel)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "QUICK_TOOLS_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "my-quick-tools")
+)
+
+
+# ---------------------------------------------------
+# Stale-while-revalidate Disk Cache
+# ---------------------------------------------------
+class SWRCache:
+    """Persistent JSON key/value cache with stale-while-revalidate semantics.
+
+    Entries live in a SQLite file shared by every process on the host, so a
+    restart or deploy starts warm. Within ``ttl`` an entry is served as-is;
+    after that it is still served immediately while a background refresh
+    replaces it. Entries older than ``max_age`` (if set) count as misses.
+    Concurrent misses on the same key in ``get`` share one fetch; the other
+    callers wait up to ``wait_timeout`` seconds for it. A small in-memory
+    layer avoids re-decoding JSON on every Streamlit rerun.
+    """
+
+    def __init__(self, namespace: str, ttl: float, path: Optional[str] = None,
+                 max_age: Optional[float] = None, wait_timeout: float = 30):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_age = max_age
+        self.wait_timeout = wait_timeout
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, "api_cache.sqlite")
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._memory: Dict[str, Tuple[Any, float]] = {}  # key -> (value, stored_at)
+        self._refreshing = set()
+        self._inflight: Dict[str, Dict[str, Any]] = {}  # key -> {"done": Event, "error": exception}
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0}
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    stored_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )"""
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += amount
+
+    def _lookup(self, keys: Iterable[str]) -> Dict[str, Tuple[Any, float]]:
+        """Return {key: (value, stored_at)}, preferring fresh in-memory copies."""
+        now = time.time()
+        found, from_disk = {}, []
+        with self._lock:
+            for key in keys:
+                entry = self._memory.get(key)
+                if entry is not None and now - entry[1] < self.ttl:
+                    found[key] = entry
+                else:
+                    from_disk.append(key)
+
+        if from_disk:
+            # Another process may have refreshed what is stale in memory
+            placeholders = ",".join("?" * len(from_disk))
+            with self._connect() as conn:
+                rows = conn.execute(
+                    f"SELECT key, value, stored_at FROM entries WHERE namespace = ? AND key IN ({placeholders})",
+                    [self.namespace, *from_disk]
+                ).fetchall()
+            with self._lock:
+                for key, value, stored_at in rows:
+                    memory = self._memory.get(key)
+                    if memory is None or memory[1] < stored_at:
+                        memory = (json.loads(value), stored_at)
+                        self._memory[key] = memory
+                    found[key] = memory
+
+        if self.max_age is not None:
+            found = {k: v for k, v in found.items() if now - v[1] < self.max_age}
+        return found
+
+    def get_many(self, keys: Iterable[str], count: bool = True) -> Dict[str, Tuple[Any, float]]:
+        """Return {key: (value, age_seconds)} for cached keys, updating the counters if ``count``."""
+        keys = list(keys)
+        now = time.time()
+        entries = {key: (value, now - stored_at) for key, (value, stored_at) in self._lookup(keys).items()}
+        if not count:
+            return entries
+        stale = sum(1 for _, age in entries.values() if age >= self.ttl)
+        self._count("hits", len(entries) - stale)
+        self._count("stale_hits", stale)
+        self._count("misses", len(keys) - len(entries))
+        return entries
+
+    def peek(self, keys: Iterable[str]) -> Dict[str, Tuple[Any, float]]:
+        """Return {key: (value, stored_at)} for cached keys, without fetching or counting."""
+        return self._lookup(list(keys))
+
+    def set(self, key: str, value: Any) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, values: Dict[str, Any]) -> None:
+        stored_at = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                [(self.namespace, key, json.dumps(value), stored_at) for key, value in values.items()]
+            )
+        with self._lock:
+            for key, value in values.items():
+                self._memory[key] = (value, stored_at)
+
+    def get(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Return the cached value, fetching on a miss and refreshing in the background when stale."""
+        entry = self.get_many([key]).get(key)
+        if entry is None:
+            return self._fetch_once(key, fetch)
+
+        value, age = entry
+        if age >= self.ttl:
+            self.refresh_in_background(key, fetch)
+        return value
+
+    def _fetch_once(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Fetch and store a missing key; concurrent callers wait for the first one's result."""
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = {"done": threading.Event(), "error": None}
+
+        if not leader:
+            if flight["done"].wait(self.wait_timeout):
+                entry = self.get_many([key], count=False).get(key)
+                if entry is not None:
+                    return entry[0]
+                if flight["error"] is not None:
+                    raise flight["error"]
+            # The first fetch is taking too long; fetch without waiting any more
+            value = fetch()
+            self.set(key, value)
+            return value
+
+        try:
+            value = fetch()
+            self.set(key, value)
+            return value
+        except Exception as e:
+            flight["error"] = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight["done"].set()
+
+    def refresh_in_background(self, key: str, fetch: Callable[[], Any]) -> bool:
+        """Start a background refresh of ``key`` unless one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self.set(key, fetch())
+                self._count("refreshes")
+            except Exception as e:
+                self._count("refresh_errors")
+                logger.warning("Background refresh of %s/%s failed: %s", self.namespace, key, e)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name=f"swr-{self.namespace}", daemon=True).start()
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus entry count and the age of the newest/oldest entry (seconds)."""
+        with self._connect() as conn:
+            count, oldest, newest = conn.execute(
+                "SELECT COUNT(*), MIN(stored_at), MAX(stored_at) FROM entries WHERE namespace = ?",
+                (self.namespace,)
+            ).fetchone()
+        now = time.time()
+        with self._lock:
+            stats = dict(self.counters)
+        stats.update({
+            "entries": count,
+            "oldest_age_s": None if oldest is None else round(now - oldest),
+            "newest_age_s": None if newest is None else round(now - newest),
+        })
+        return stats
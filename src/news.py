@@ -1,12 +1,51 @@
-import requests
+import asyncio
+import logging
+import os
+import threading
+import time
 import json
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from api_client import default_client
+from disk_cache import SWRCache
+
+logger = logging.getLogger(__name__)
+
+# Overridable so the client can be pointed at a local stub server
+url = os.environ.get("NEWS_API_URL", "https://real-time-news-data.p.rapidapi.com/top-headlines")
+
+country_codes = {
+    "IN": "India",
+    "US": "United States",
+    "GB": "United Kingdom",
+    "AU": "Australia",
+    "CA": "Canada",
+    "DE": "Germany",
+    "FR": "France",
+    "IT": "Italy",
+    "JP": "Japan",
+    "CN": "China"
+}
+
+NEWS_TTL = 86400  # headlines are refreshed once a day
+REQUEST_TIMEOUT = 20  # seconds per news API request
+MAX_CONNECTIONS = 4  # concurrent news API requests when prefetching
+PREFETCH_INTERVAL = 3600  # re-warm expired countries every hour
+
+# Only the fields the News page displays are kept in the cache
+NEWS_FIELDS = ("title", "source_name", "snippet", "published_datetime_utc", "link")
+
+# Headlines are cached on disk per country and shared by every process, so a
+# restart starts warm; expired entries are served while they refresh.
+news_cache = SWRCache("news", ttl=NEWS_TTL)
+
 
-url = "https://real-time-news-data.p.rapidapi.com/top-headlines"
-# Function to fetch news with caching - the decorator caches the function output
-# for 24 hours (86400 seconds)
-@st.cache_data(ttl=86400)  # Cache data for 24 hours
 def get_news(country_code):
+    return news_cache.get(country_code, lambda: _fetch_news(country_code))
+
+
+def _fetch_news(country_code):
     querystring = {"limit":"500","country":country_code,"lang":"en"}
 
     headers = {
@@ -14,8 +53,105 @@ def get_news(country_code):
         "x-rapidapi-host": "real-time-news-data.p.rapidapi.com"
     }
 
-    response = requests.get(url, headers=headers, params=querystring)
-    return response.json()
+    response = default_client.get(url, headers=headers, params=querystring, timeout=REQUEST_TIMEOUT)
+    # Don't cache quota/error payloads for a day; the stale copy is kept instead
+    response.raise_for_status()
+    return trim_articles(response.json())
+
+
+def trim_articles(payload: Dict) -> Dict:
+    """Keep only the displayed fields of each article to shrink cache entries."""
+    if not isinstance(payload, dict) or "data" not in payload:
+        return payload
+    articles = [{field: article.get(field) for field in NEWS_FIELDS} for article in payload["data"] or []]
+    return {**payload, "data": articles}
+
+
+def paginate(items: List, page: int, page_size: int) -> Tuple[List, int]:
+    """Return the items on a 1-based ``page`` and the total number of pages."""
+    page_count = max(1, -(-len(items) // page_size))
+    page = min(max(page, 1), page_count)
+    start = (page - 1) * page_size
+    return items[start:start + page_size], page_count
+
+
+async def prefetch_news(codes: List[str], max_concurrency: int = MAX_CONNECTIONS) -> Dict[str, bool]:
+    """Warm the ``get_news`` cache for every country code concurrently.
+
+    Returns {country_code: succeeded}. Already-cached countries return
+    immediately, so this is cheap to call on a schedule. Fetches run on a
+    pool of ``max_concurrency`` threads, so a slow request holds its slot
+    until it really finishes; each one is bounded by the API client's deadline.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def warm(code: str, pool: ThreadPoolExecutor):
+        try:
+            await loop.run_in_executor(pool, get_news, code)
+            return code, True
+        except Exception as e:
+            logger.warning("News prefetch for %s failed: %s", code, e)
+            return code, False
+
+    with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="news-prefetch") as pool:
+        return dict(await asyncio.gather(*(warm(code, pool) for code in codes)))
+
+
+def start_news_prefetcher(codes: List[str], interval: float = PREFETCH_INTERVAL) -> threading.Thread:
+    """Prefetch news for ``codes`` now and every ``interval`` seconds in a daemon thread."""
+    def run():
+        while True:
+            started = time.perf_counter()
+            results = asyncio.run(prefetch_news(codes))
+            logger.info("News prefetch: %d/%d countries warm in %.2fs",
+                        sum(results.values()), len(results), time.perf_counter() - started)
+            time.sleep(interval)
+
+    thread = threading.Thread(target=run, name="news-prefetch", daemon=True)
+    thread.start()
+    return thread
+
+
+def _cached_news() -> Tuple[Tuple, Dict[str, Dict]]:
+    """(version, {country_code: payload}) for countries already in news_cache; never fetches.
+
+    ``version`` changes whenever a country is added or refreshed.
+    """
+    entries = news_cache.peek(country_codes)
+    version = tuple(sorted((code, stored_at) for code, (_, stored_at) in entries.items()))
+    return version, {code: payload for code, (payload, _) in entries.items()}
+
+
+def get_news_index():
+    """Search index over the headlines cached so far, rebuilt when they change."""
+    version, payloads = _cached_news()
+    return _build_news_index(version, payloads)
+
+
+def get_news_sources() -> List[str]:
+    """Source names in the cached headlines, without building the search index."""
+    version, payloads = _cached_news()
+    return _news_sources(version, payloads)
+
+
+# Leading underscore: Streamlit keys these caches on ``version`` only
+@st.cache_resource(max_entries=2)
+def _build_news_index(version: Tuple, _payloads: Dict[str, Dict]):
+    # Imported here so the dashboard's startup path does not load numpy
+    from news_index import NewsIndex
+    return NewsIndex.build(_payloads)
+
+
+@st.cache_data(max_entries=2)
+def _news_sources(version: Tuple, _payloads: Dict[str, Dict]) -> List[str]:
+    return sorted({article.get("source_name") or "" for payload in _payloads.values()
+                   for article in (payload or {}).get("data") or []} - {""})
+
+
+@st.cache_resource
+def ensure_news_prefetcher() -> threading.Thread:
+    """Start the background prefetcher once per server process."""
+    return start_news_prefetcher(list(country_codes))
 
 if __name__ == "__main__":
     # Example usage
@@ -28,6 +164,6 @@ if __name__ == "__main__":
         print(f"  Snippet: {article['snippet']}")
         print(f"  Published Date: {article['published_datetime_utc']}")
         print("\n" + "-"*50 + "\n")
-        if i > 3: 
+        if i > 3:
             break
         i += 1
@@ -0,0 +1,226 @@
+import re
+import zlib
+import numpy as np
+from bisect import bisect_left
+from collections import abc
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "in", "is",
+    "it", "its", "of", "on", "or", "that", "the", "to", "was", "were", "will", "with",
+}
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-case word tokens without stopwords."""
+    return [t for t in TOKEN_RE.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+# ---------------------------------------------------
+# News Index Class
+# ---------------------------------------------------
+class NewsIndex:
+    """In-memory inverted index over cached news articles, across countries.
+
+    Supports keyword search (every query word must match; the last word also
+    matches as a prefix, for search-as-you-type), source and country filters,
+    and collapsing of near-duplicate wire stories. Near-duplicates are found
+    with MinHash signatures over word shingles of title + snippet, bucketed
+    with LSH banding, and grouped when their estimated Jaccard similarity is
+    at least ``threshold``. ``finalize`` sorts articles newest first once and
+    stores postings as positions in that order, so a search is a few boolean
+    mask operations and article dicts are only built for the page shown.
+    """
+
+    def __init__(self, shingle_size: int = 3, num_perm: int = 64, bands: int = 16,
+                 threshold: float = 0.6, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.shingle_size = shingle_size
+        self.num_perm = num_perm
+        self.bands = bands
+        self.threshold = threshold
+        rng = np.random.RandomState(seed)
+        self._perm_a = rng.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+        self._perm_b = rng.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+
+        self.articles: List[Dict] = []
+        self._postings: Dict[str, Set[int]] = {}
+        self._by_source: Dict[str, Set[int]] = {}
+        self._by_country: Dict[str, Set[int]] = {}
+        self._signatures: List[np.ndarray] = []
+        self._vocabulary: List[str] = []
+        self._cluster: np.ndarray = np.zeros(0, dtype=np.int64)
+        # Set by finalize: position (newest first) -> doc id, and positions per key
+        self._order: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._positions: Dict[str, np.ndarray] = {}
+        self._source_positions: Dict[str, np.ndarray] = {}
+        self._country_positions: Dict[str, np.ndarray] = {}
+        self._position_cluster: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._cluster_positions: Dict[int, np.ndarray] = {}  # clusters with 2+ articles only
+
+    @classmethod
+    def build(cls, payloads: Dict[str, Dict], **kwargs) -> "NewsIndex":
+        """Index ``{country_code: get_news(country_code)}`` payloads."""
+        index = cls(**kwargs)
+        for country, payload in payloads.items():
+            for article in (payload or {}).get("data") or []:
+                index.add(article, country)
+        index.finalize()
+        return index
+
+    def add(self, article: Dict, country: str) -> None:
+        """Add one article; call ``finalize`` after the last one."""
+        doc_id = len(self.articles)
+        self.articles.append({**article, "country": country})
+
+        source = article.get("source_name") or ""
+        text = f"{article.get('title') or ''} {article.get('snippet') or ''}"
+        for token in set(tokenize(text) + tokenize(source)):
+            self._postings.setdefault(token, set()).add(doc_id)
+        self._by_source.setdefault(source, set()).add(doc_id)
+        self._by_country.setdefault(country, set()).add(doc_id)
+        self._signatures.append(self._minhash(tokenize(text)))
+
+    def finalize(self) -> None:
+        """Build the prefix vocabulary, date order, position arrays and near-duplicate clusters."""
+        n = len(self.articles)
+        self._order = np.array(sorted(range(n), reverse=True,
+                                      key=lambda i: self.articles[i].get("published_datetime_utc") or ""),
+                               dtype=np.int64)
+        rank = np.empty(n, dtype=np.int64)
+        rank[self._order] = np.arange(n)
+
+        def as_positions(index: Dict[str, Set[int]]) -> Dict[str, np.ndarray]:
+            return {key: np.sort(rank[list(docs)]) for key, docs in index.items()}
+
+        self._vocabulary = sorted(self._postings)
+        self._positions = as_positions(self._postings)
+        self._source_positions = as_positions(self._by_source)
+        self._country_positions = as_positions(self._by_country)
+        self._cluster = self._find_clusters()
+        self._position_cluster = self._cluster[self._order]
+        members: Dict[int, List[int]] = {}
+        for position, cluster in enumerate(self._position_cluster.tolist()):
+            members.setdefault(cluster, []).append(position)
+        self._cluster_positions = {c: np.array(p) for c, p in members.items() if len(p) > 1}
+
+    def _minhash(self, tokens: List[str]) -> np.ndarray:
+        k = self.shingle_size
+        shingles = {" ".join(tokens[i:i + k]) for i in range(max(1, len(tokens) - k + 1))}
+        hashes = np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles))
+        # (a * x + b) mod p for every permutation and shingle, min per permutation
+        permuted = (np.outer(self._perm_a, hashes) + self._perm_b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    def _find_clusters(self) -> np.ndarray:
+        n = len(self.articles)
+        parent = np.arange(n)
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        if n == 0:
+            return parent
+        signatures = np.vstack(self._signatures)
+        rows = self.num_perm // self.bands
+        for band in range(self.bands):
+            buckets: Dict[bytes, List[int]] = {}
+            band_values = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+            for doc_id in range(n):
+                buckets.setdefault(band_values[doc_id].tobytes(), []).append(doc_id)
+            for members in buckets.values():
+                first = members[0]
+                for other in members[1:]:
+                    root_a, root_b = find(first), find(other)
+                    if root_a == root_b:
+                        continue
+                    similarity = np.mean(signatures[first] == signatures[other])
+                    if similarity >= self.threshold:
+                        # Keep the earliest article as the cluster representative
+                        parent[max(root_a, root_b)] = min(root_a, root_b)
+        return np.array([find(i) for i in range(n)])
+
+    @property
+    def sources(self) -> List[str]:
+        return sorted(s for s in self._by_source if s)
+
+    def _mask(self, positions: Iterable[np.ndarray]) -> np.ndarray:
+        """Boolean mask over positions: True where any of ``positions`` points."""
+        mask = np.zeros(len(self.articles), dtype=bool)
+        for p in positions:
+            mask[p] = True
+        return mask
+
+    def _match_query(self, query: str) -> Optional[np.ndarray]:
+        tokens = tokenize(query)
+        if not tokens:
+            return None
+        *exact, last = tokens
+        # Last word also matches as a prefix (search as you type)
+        lo = hi = bisect_left(self._vocabulary, last)
+        while hi < len(self._vocabulary) and self._vocabulary[hi].startswith(last):
+            hi += 1
+        mask = self._mask(self._positions[token] for token in self._vocabulary[lo:hi])
+        for token in exact:
+            mask &= self._mask([self._positions[token]] if token in self._positions else [])
+        return mask
+
+    def search(self, query: str = "", sources: Optional[Iterable[str]] = None,
+               countries: Optional[Iterable[str]] = None, collapse: bool = True) -> "SearchResults":
+        """Return matching articles, newest first.
+
+        With ``collapse`` only one article per near-duplicate cluster is kept;
+        it carries ``duplicates`` (how many were collapsed) and ``also_from``
+        (their sources). The result is a sequence whose article dicts are
+        built when indexed or sliced, e.g. one page at a time.
+        """
+        mask = self._match_query(query)
+        for field, index in ((sources, self._source_positions), (countries, self._country_positions)):
+            if field:
+                docs = self._mask(index[value] for value in field if value in index)
+                mask = docs if mask is None else mask & docs
+        if mask is None:
+            mask = np.ones(len(self.articles), dtype=bool)
+        return SearchResults(self, mask, collapse)
+
+
+class SearchResults(abc.Sequence):
+    """Matching articles, newest first; dicts are only built for the items accessed."""
+
+    def __init__(self, index: NewsIndex, mask: np.ndarray, collapse: bool):
+        self._index = index
+        self._mask = mask
+        self.collapse = collapse
+        positions = np.flatnonzero(mask)
+        if collapse and len(positions):
+            clusters = index._position_cluster[positions]
+            # Reversed assignment: the newest matching position of each cluster wins
+            newest = np.empty(len(mask), dtype=np.int64)
+            newest[clusters[::-1]] = positions[::-1]
+            positions = positions[newest[clusters] == positions]
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        if isinstance(item, slice):
+            return [self._article(position) for position in self._positions[item]]
+        return self._article(self._positions[item])
+
+    def _article(self, position: int) -> Dict:
+        index = self._index
+        article = index.articles[index._order[position]]
+        if not self.collapse:
+            return article
+        members = index._cluster_positions.get(int(index._position_cluster[position]), np.zeros(0, dtype=np.int64))
+        # Matching members other than this one, the newest of them
+        rest = members[self._mask[members] & (members != position)]
+        also_from = sorted({index.articles[index._order[p]].get("source_name") or "" for p in rest} - {""})
+        return {**article, "duplicates": len(rest), "also_from": also_from}
@@ -0,0 +1,222 @@
+import json
+import os
+import sqlite3
+import pandas as pd
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from disk_cache import DEFAULT_CACHE_DIR
+
+DateLike = Union[date, datetime, str, pd.Timestamp]
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# Gaps shorter than this that come back empty are weekends/holidays,
+# so they are marked as covered instead of being re-requested forever.
+MAX_EMPTY_GAP = timedelta(days=5)
+
+# yfinance returns split/dividend-adjusted prices, so a corporate action
+# rewrites every earlier bar. Gaps are fetched with this much overlap into
+# the stored range; if the overlapping closes moved, the stored history is
+# from an older adjustment and is dropped.
+REFETCH_OVERLAP = timedelta(days=7)
+ADJUSTMENT_TOLERANCE = 1e-4
+
+
+def _as_day(value: DateLike) -> pd.Timestamp:
+    """Normalize any date-like value to a midnight, tz-naive Timestamp."""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts.normalize()
+
+
+def _iso(value: pd.Timestamp) -> str:
+    return value.strftime("%Y-%m-%d")
+
+
+# ---------------------------------------------------
+# On-disk OHLCV Store
+# ---------------------------------------------------
+class OHLCVStore:
+    """SQLite-backed daily OHLCV store keyed by ticker.
+
+    Besides the bars themselves, the store records one contiguous
+    [start, end) date range per ticker that has already been fetched, so
+    callers only need to download the missing head or tail (plus a short
+    overlap used to detect re-adjusted prices, see ``write``).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, "ohlcv.sqlite")
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS bars (
+                    ticker TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    open REAL, high REAL, low REAL, close REAL, volume REAL,
+                    PRIMARY KEY (ticker, date)
+                )"""
+            )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS coverage (
+                    ticker TEXT PRIMARY KEY,
+                    start TEXT NOT NULL,
+                    end TEXT NOT NULL
+                )"""
+            )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS indicator_state (
+                    ticker TEXT PRIMARY KEY,
+                    state TEXT NOT NULL
+                )"""
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per call keeps the store safe to share
+        # between Streamlit sessions (threads) and worker processes.
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def coverage(self, ticker: str) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """Return the [start, end) range already stored for a ticker."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT start, end FROM coverage WHERE ticker = ?", (ticker,)
+            ).fetchone()
+        if row is None:
+            return None
+        return pd.Timestamp(row[0]), pd.Timestamp(row[1])
+
+    def missing_ranges(self, ticker: str, start: DateLike, end: DateLike) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """Return the [start, end) ranges that still need to be downloaded.
+
+        Head and tail gaps are widened up to the stored range so coverage
+        always stays contiguous, and reach ``REFETCH_OVERLAP`` into it so
+        ``write`` can compare fresh bars with stored ones.
+        """
+        start, end = _as_day(start), _as_day(end)
+        covered = self.coverage(ticker)
+        if covered is None:
+            return [(start, end)] if start < end else []
+
+        cov_start, cov_end = covered
+        gaps = []
+        if start < cov_start:
+            gaps.append((start, min(cov_start + REFETCH_OVERLAP, cov_end)))
+        if end > cov_end:
+            gaps.append((max(cov_end - REFETCH_OVERLAP, cov_start), end))
+        return gaps
+
+    def write(self, ticker: str, df: pd.DataFrame, start: DateLike, end: DateLike) -> bool:
+        """Upsert downloaded bars and extend the ticker's covered range.
+
+        Returns False if the new bars disagree with stored ones on the
+        dates both cover (a split or dividend re-adjusted the history). The
+        ticker's old bars are then dropped and only [start, end) is kept,
+        so the caller should load the full range again.
+        """
+        start, end = _as_day(start), _as_day(end)
+        frame = df[OHLCV_COLUMNS].astype(float)
+        rows = [
+            (ticker, _iso(_as_day(idx)), *values)
+            for idx, values in zip(frame.index, frame.itertuples(index=False, name=None))
+        ]
+
+        # A long range with no bars at all is more likely a failed request
+        # than a market holiday - store nothing and retry next time.
+        if not rows and end - start > MAX_EMPTY_GAP:
+            return True
+
+        # Today's bar may still be forming, so never mark it as covered
+        end = min(end, _as_day(datetime.today()))
+
+        with self._connect() as conn:
+            covered = conn.execute(
+                "SELECT start, end FROM coverage WHERE ticker = ?", (ticker,)
+            ).fetchone()
+            consistent = covered is None or self._matches_stored(conn, ticker, rows, *covered)
+            if not consistent:
+                self._delete(conn, ticker)
+                covered = None
+            conn.executemany(
+                "INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            if start >= end:
+                return consistent
+            if covered is not None:
+                start = min(start, pd.Timestamp(covered[0]))
+                end = max(end, pd.Timestamp(covered[1]))
+            conn.execute(
+                "INSERT OR REPLACE INTO coverage VALUES (?, ?, ?)",
+                (ticker, _iso(start), _iso(end))
+            )
+        return consistent
+
+    @staticmethod
+    def _matches_stored(conn: sqlite3.Connection, ticker: str, rows: List[Tuple],
+                        cov_start: str, cov_end: str) -> bool:
+        """True if the closes in ``rows`` match the stored closes on covered dates."""
+        # Bars from cov_end on are not covered (e.g. today's forming bar) and may differ
+        fresh = {row[1]: row[5] for row in rows if cov_start <= row[1] < cov_end}
+        if not fresh:
+            return True
+        stored = conn.execute(
+            "SELECT date, close FROM bars WHERE ticker = ? AND date >= ? AND date <= ?",
+            (ticker, min(fresh), max(fresh))
+        ).fetchall()
+        return all(
+            abs(close - fresh[day]) <= ADJUSTMENT_TOLERANCE * abs(fresh[day])
+            for day, close in stored if day in fresh
+        )
+
+    def read(self, ticker: str, start: DateLike, end: DateLike) -> pd.DataFrame:
+        """Read stored bars in [start, end) as a yfinance-shaped DataFrame."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """SELECT date, open, high, low, close, volume FROM bars
+                   WHERE ticker = ? AND date >= ? AND date < ? ORDER BY date""",
+                (ticker, _iso(_as_day(start)), _iso(_as_day(end)))
+            ).fetchall()
+
+        df = pd.DataFrame(rows, columns=["Date"] + OHLCV_COLUMNS)
+        df["Date"] = pd.to_datetime(df["Date"])
+        return df.set_index("Date")
+
+    def save_indicator_state(self, ticker: str, state: Dict) -> None:
+        """Persist a JSON-serializable indicator state (e.g. ``StreamingIndicators.to_dict()``)."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO indicator_state VALUES (?, ?)",
+                (ticker, json.dumps(state))
+            )
+
+    def load_indicator_state(self, ticker: str) -> Optional[Dict]:
+        """Return the saved indicator state for a ticker, if any."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT state FROM indicator_state WHERE ticker = ?", (ticker,)
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, ticker: Optional[str]) -> None:
+        for table in ("bars", "coverage", "indicator_state"):
+            if ticker is None:
+                conn.execute(f"DELETE FROM {table}")
+            else:
+                conn.execute(f"DELETE FROM {table} WHERE ticker = ?", (ticker,))
+
+    def clear(self, ticker: Optional[str] = None) -> None:
+        """Drop stored bars (and indicator state) for one ticker, or everything."""
+        with self._connect() as conn:
+            self._delete(conn, ticker)
@@ -0,0 +1,135 @@
+import os
+import shutil
+import tempfile
+import time
+import streamlit as st
+from cnvt_image_drawing import convert_batch, convert_image_bytes, list_batch_inputs, stage_cache
+
+# Batch output ZIPs are deleted once downloaded; ones never downloaded
+# (closed tabs, expired sessions) are swept after BATCH_OUTPUT_MAX_AGE seconds
+BATCH_OUTPUT_DIR = os.path.join(tempfile.gettempdir(), "quick_tools_batches")
+BATCH_OUTPUT_MAX_AGE = 3600
+
+
+def _sweep_batch_outputs(max_age: float = BATCH_OUTPUT_MAX_AGE) -> None:
+    os.makedirs(BATCH_OUTPUT_DIR, exist_ok=True)
+    cutoff = time.time() - max_age
+    for entry in os.scandir(BATCH_OUTPUT_DIR):
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:  # removed by another session meanwhile
+            pass
+
+
+def _remove_batch_output() -> None:
+    """Download callback: the button already holds the ZIP bytes, so the file can go."""
+    result = st.session_state.get("convert_batch_result")
+    if result and result["path"]:
+        if os.path.exists(result["path"]):
+            os.remove(result["path"])
+        result["path"] = None
+
+
+def render():
+    st.header("Image Convert — Outline / Sketch")
+    st.write("Upload an image and convert it to a clean outline sketch.")
+
+    # Sidebar settings - only shown on this page
+    st.sidebar.markdown("### Image Convert Settings")
+    blur_ksize = st.sidebar.slider("Blur kernel (bilateral d)", min_value=1, max_value=31, value=9, step=2)
+    sigma_color = st.sidebar.slider("Sigma Color (bilateral)", min_value=1, max_value=200, value=75, step=1)
+    sigma_space = st.sidebar.slider("Sigma Space (bilateral)", min_value=1, max_value=200, value=75, step=1)
+    min_area = st.sidebar.slider("Min contour area to keep", min_value=1, max_value=5000, value=100, step=1)
+    with st.sidebar.expander("Large images"):
+        tiled = st.checkbox("Tiled multi-core processing", value=False, key="convert_tiled")
+        tile_size = st.select_slider("Tile size (px)", options=[256, 512, 1024, 2048], value=1024,
+                                     key="convert_tile_size", disabled=not tiled)
+        max_memory_mb = st.slider("Memory limit (MB)", min_value=64, max_value=2048, value=512, step=64,
+                                  key="convert_max_memory")
+
+    convert_mode = st.radio("Mode", ["Single image", "Batch (ZIP)"], horizontal=True, key="convert_mode")
+    convert_params = {
+        "blur_ksize": blur_ksize, "sigma_color": sigma_color, "sigma_space": sigma_space,
+        "min_area": min_area, "tile_size": tile_size if tiled else None,
+        "max_memory_mb": max_memory_mb,
+    }
+
+    if convert_mode == "Batch (ZIP)":
+        zip_file = st.file_uploader("Choose a ZIP of images", type=["zip"], key="convert_zip")
+        if zip_file is not None and st.button("Convert all", key="convert_batch"):
+            # Input and output archives live in temp files, never fully in memory
+            _remove_batch_output()
+            st.session_state.pop("convert_batch_result", None)
+            _sweep_batch_outputs()
+            with tempfile.NamedTemporaryFile(suffix=".zip") as source:
+                shutil.copyfileobj(zip_file, source)
+                source.flush()
+                total = len(list_batch_inputs(source.name))
+                progress = st.progress(0.0, text=f"Converting {total} images...")
+                done = []
+
+                def on_result(row):
+                    done.append(row)
+                    progress.progress(len(done) / max(total, 1), text=f"{len(done)}/{total}: {row['File']}")
+
+                output = tempfile.NamedTemporaryFile(suffix=".zip", dir=BATCH_OUTPUT_DIR, delete=False)
+                output.close()
+                started = time.perf_counter()
+                try:
+                    report = convert_batch(source.name, output.name, on_result=on_result, **convert_params)
+                except Exception as e:
+                    st.error(f"Batch conversion failed: {e}")
+                    os.remove(output.name)
+                else:
+                    st.session_state["convert_batch_result"] = {
+                        "path": output.name, "report": report, "seconds": time.perf_counter() - started,
+                        "name": f"{zip_file.name.rsplit('.', 1)[0]}_outlines.zip",
+                    }
+                progress.empty()
+
+        result = st.session_state.get("convert_batch_result")
+        if result is not None:
+            converted = sum(row["Status"] == "ok" for row in result["report"])
+            st.success(f"Converted {converted}/{len(result['report'])} images in {result['seconds']:.1f}s")
+            st.dataframe(result["report"], use_container_width=True, hide_index=True)
+            if result["path"] and os.path.exists(result["path"]):
+                with open(result["path"], "rb") as f:
+                    st.download_button("Download outlines ZIP", data=f, file_name=result["name"],
+                                       mime="application/zip", on_click=_remove_batch_output)
+            else:
+                st.caption("The ZIP was downloaded or has expired; convert again to get a new one.")
+    else:
+        uploaded_file = st.file_uploader("Choose an image", type=["png", "jpg", "jpeg", "bmp", "tiff"])
+        if uploaded_file is not None:
+            # Read uploaded file bytes
+            input_bytes = uploaded_file.read()
+
+            # Display original image
+            st.subheader("Original Image")
+            st.image(input_bytes, caption=uploaded_file.name)
+
+            # Convert image with selected parameters
+            try:
+                output_png = convert_image_bytes(
+                    input_bytes,
+                    **convert_params,
+                    cache=stage_cache,  # slider tweaks only redo the stages they affect
+                )
+            except Exception as e:
+                st.error(f"Image conversion failed: {e}")
+            else:
+                st.subheader("Converted Outline")
+                st.image(output_png, caption="Outline", use_column_width=True)
+                cache_stats = stage_cache.stats()
+                st.caption(f"Stage cache: {cache_stats['entries']} entries, "
+                           f"{cache_stats['bytes'] / 2**20:.0f}/{cache_stats['max_bytes'] / 2**20:.0f} MB, "
+                           f"{cache_stats['hits']} hits / {cache_stats['misses']} misses")
+
+                # Provide download button
+                st.download_button(
+                    label="Download outline PNG",
+                    data=output_png,
+                    file_name=f"{uploaded_file.name.rsplit('.',1)[0]}_outline.png",
+                    mime="image/png",
+                )
@@ -0,0 +1,103 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Navigation label -> page module (each module exposes render()). Pages live in
+# flat page_*.py modules; a pages/ directory would turn on Streamlit's own
+# multipage navigation.
+PAGES = {
+    "📰 News": "page_news",
+    "🌍 World Time": "page_worldtime",
+    "📈 Stock Market": "page_stocks",
+    "🖼️ Image Convert": "page_image_convert",
+    "📊 Stock Screener": "page_screener",
+}
+
+# First-import budget per page in milliseconds, on top of BASE_MODULES
+IMPORT_BUDGET_MS = {
+    "page_news": 100,
+    "page_worldtime": 100,
+    "page_stocks": 100,
+    "page_image_convert": 500,
+    "page_screener": 2500,
+}
+
+# Imported by main_dashboard on every run, before any page
+BASE_MODULES = ("streamlit", "news", "page_loader")
+
+# Heavy libraries worth knowing about when reading the report
+HEAVY_MODULES = ("numpy", "pandas", "cv2", "yfinance", "ta", "plotly")
+
+# module name -> milliseconds of its first import in this process
+import_times: Dict[str, float] = {}
+
+
+def load_page(module_name: str):
+    """Import a page module on first use, recording how long the import took."""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    import_times[module_name] = (time.perf_counter() - started) * 1000
+    return module
+
+
+def import_report() -> List[Dict]:
+    """One row per page: first-import time in this process against its budget."""
+    rows = []
+    for label, module_name in PAGES.items():
+        elapsed = import_times.get(module_name)
+        rows.append({
+            "Page": label,
+            "Module": module_name,
+            "Import (ms)": None if elapsed is None else round(elapsed, 1),
+            "Budget (ms)": IMPORT_BUDGET_MS.get(module_name),
+            "Within budget": None if elapsed is None else elapsed <= IMPORT_BUDGET_MS.get(module_name, float("inf")),
+        })
+    return rows
+
+
+def loaded_heavy_modules() -> List[str]:
+    return [name for name in HEAVY_MODULES if name in sys.modules]
+
+
+def measure_cold_imports(modules: Optional[List[str]] = None,
+                         preload: Tuple[str, ...] = BASE_MODULES) -> List[Dict]:
+    """Import time of each module in a fresh interpreter, after importing ``preload``.
+
+    With the default preload this is a page's first-use cost inside the
+    running dashboard. ``heavy`` lists the libraries the import pulled in.
+    """
+    rows = []
+    for module_name in modules or list(PAGES.values()):
+        script = (
+            "import json, sys, time\n"
+            + "".join(f"import {name}\n" for name in preload)
+            + f"before = set(m for m in {list(HEAVY_MODULES)!r} if m in sys.modules)\n"
+            "started = time.perf_counter()\n"
+            f"import {module_name}\n"
+            "print(json.dumps([(time.perf_counter() - started) * 1000, "
+            f"[m for m in {list(HEAVY_MODULES)!r} if m in sys.modules and m not in before]]))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        row = {"Module": module_name, "Budget (ms)": IMPORT_BUDGET_MS.get(module_name)}
+        if result.returncode == 0:
+            elapsed, heavy = json.loads(result.stdout.strip().splitlines()[-1])
+            row.update({"Import (ms)": round(elapsed, 1), "Heavy modules": ", ".join(heavy)})
+        else:
+            row["Error"] = (result.stderr.strip().splitlines() or ["import failed"])[-1]
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    # Cold-start cost of what every dashboard run imports, then each page on top of it
+    for row in measure_cold_imports([", ".join(BASE_MODULES)], preload=()):
+        print(row)
+    for row in measure_cold_imports():
+        print(row)
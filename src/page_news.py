@@ -0,0 +1,56 @@
+import streamlit as st
+from news import get_news, get_news_index, get_news_sources, country_codes, paginate, news_cache
+
+
+def render():
+    st.header("Latest News Headlines")
+    selected_country = st.selectbox("Select a Country Code:", list(country_codes.values()))
+    # Get the corresponding country code
+    selected_country_cd = next((k for k, v in country_codes.items() if v == selected_country), None)
+
+    # Search across all countries (keyword + source), with duplicate collapsing
+    search_query = st.text_input("🔎 Search headlines across all countries", key="news_search")
+    with st.expander("Search filters"):
+        selected_sources = st.multiselect("Sources", get_news_sources(), key="news_sources")
+        collapse = st.checkbox("Collapse near-duplicate stories", value=True, key="news_collapse")
+
+    if search_query or selected_sources:
+        # Covers the countries fetched so far (the prefetcher fills in the rest)
+        articles = get_news_index().search(search_query, sources=selected_sources, collapse=collapse)
+        feed_key = "search"
+    else:
+        try:
+            news_data = get_news(selected_country_cd)
+        except Exception as e:
+            st.error(f"Could not load news for {selected_country}: {e}")
+            news_data = {}
+        articles = news_data.get("data") or []
+        feed_key = selected_country_cd
+
+    # Render only the current page of articles
+    col_size, col_page = st.columns(2)
+    with col_size:
+        page_size = st.selectbox("Articles per page", [10, 25, 50, 100], key="news_page_size")
+    page_count = paginate(articles, 1, page_size)[1]
+    with col_page:
+        page_number = st.number_input(
+            f"Page (of {page_count})", min_value=1, max_value=page_count, value=1, step=1,
+            key=f"news_page_{feed_key}_{page_size}"
+        )
+    page_articles, _ = paginate(articles, int(page_number), page_size)
+    first = (int(page_number) - 1) * page_size
+    st.caption(f"Showing {first + 1 if articles else 0}–{first + len(page_articles)} of {len(articles)} articles")
+
+    for article in page_articles:
+        st.subheader(article["title"])
+        st.write(f"**Source:** {article['source_name']}")
+        st.write(f"**Snippet:** {article['snippet']}")
+        st.write(f"**Published Date:** {article['published_datetime_utc']}")
+        if article.get("duplicates"):
+            st.write(f"<small>+{article['duplicates']} similar stories from: "
+                     f"{', '.join(article['also_from'])}</small>", unsafe_allow_html=True)
+        st.write(f"[Read More]({article['link']})")
+        st.write("---")
+
+    with st.sidebar.expander("🗄️ News cache"):
+        st.json(news_cache.stats())
@@ -0,0 +1,9 @@
+import streamlit as st
+from screener import render_screener_page
+
+
+def render():
+    st.header("📊 Multi-Stock Screener")
+    
+    # Sidebar settings - only shown on this page
+    render_screener_page()
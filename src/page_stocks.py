@@ -0,0 +1,34 @@
+import streamlit as st
+from stocks import quote_cache, render_live_quotes
+from ticker_universe import get_universe
+
+
+def render():
+    universe = get_universe()
+
+    # Only matches of the current search (plus the selection) are sent to the browser
+    query = st.text_input("🔎 Search tickers or company names", key="stock_search")
+    selected = st.session_state.get("stock_selection", [])
+    options = list(dict.fromkeys(selected + (universe.search(query) if query else [])))
+
+    def add_sector():
+        current = st.session_state.get("stock_selection", [])
+        sector_tickers = universe.in_sector(st.session_state["stock_sector"])
+        st.session_state["stock_selection"] = list(dict.fromkeys(current + sector_tickers))
+
+    col_sector, col_add = st.columns([3, 1])
+    col_sector.selectbox("Add a whole sector", universe.sector_names, key="stock_sector")
+    col_add.button("Add sector", key="stock_add_sector", on_click=add_sector)
+    selected_ticker = st.multiselect("Select a Stock Ticker:", options, format_func=universe.label,
+                                     key="stock_selection")
+    st.header("Live Stock Market Data")
+    submitted = st.button("Get Stock Data")
+    if submitted:
+        # Keep the submitted tickers across reruns (e.g. when live mode is toggled)
+        st.session_state["quote_tickers"] = ",".join(selected_ticker)
+    # If no tickers were submitted yet, use default data
+    flattened_ticker = st.session_state.get("quote_tickers") or "AAPL,MSFT,TSLA,GOOG,META,^SPX"
+    render_live_quotes(flattened_ticker)
+
+    with st.sidebar.expander("🗄️ Quote cache"):
+        st.json(quote_cache.stats())
@@ -0,0 +1,38 @@
+import streamlit as st
+import streamlit.components.v1 as components
+from worldtime import CountryTime, WorldClock, clock_grid_html
+
+
+def render():
+    st.header("🌍 World Wall Clock — Live Time Across Countries")
+    
+    # Countries & Timezones
+    countries = [
+        CountryTime("United States (New York)", "America/New_York"),
+        CountryTime("United States (Chicago)", "America/Chicago"),
+        CountryTime("United States (Denver)", "America/Denver"),
+        CountryTime("United States (Los Angeles)", "America/Los_Angeles"),
+        CountryTime("India", "Asia/Kolkata"),
+        CountryTime("United Kingdom", "Europe/London"),
+        CountryTime("Japan", "Asia/Tokyo"),
+        CountryTime("Australia (Sydney)", "Australia/Sydney"),
+        CountryTime("UAE (Dubai)", "Asia/Dubai"),
+        CountryTime("Singapore", "Asia/Singapore"),
+        CountryTime("China (Beijing)", "Asia/Shanghai"),
+        CountryTime("Russia (Moscow)", "Europe/Moscow"),
+    ]
+    
+    # Add any IANA zone; search runs on the server index, not over the full list in the browser
+    zone_query = st.text_input("🔎 Add a time zone (city or zone name)", key="zone_search")
+    added_zones = st.session_state.get("extra_zones", [])
+    extra_zones = st.multiselect(
+        "Extra time zones",
+        options=list(dict.fromkeys(added_zones + WorldClock.search_zones(zone_query))),
+        key="extra_zones"
+    )
+    countries += [CountryTime(zone.rsplit("/", 1)[-1].replace("_", " "), zone) for zone in extra_zones]
+    
+    # Wall-Clock Grid Display (4 columns), ticking in the browser every second
+    snapshot = WorldClock(countries).snapshot()
+    rows = -(-len(snapshot) // 4)
+    components.html(clock_grid_html(snapshot, columns=4), height=rows * 170, scrolling=False)
@@ -0,0 +1,81 @@
+import json
+import logging
+import threading
+import time
+import pandas as pd
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger("my_quick_tools.profiling")
+
+
+# ---------------------------------------------------
+# Pipeline Profiler Class
+# ---------------------------------------------------
+class PipelineProfiler:
+    """Records per-ticker, per-stage wall time, rows and bytes for the screener.
+
+    Each finished stage is kept in ``records`` and emitted as one JSON log
+    record on the ``my_quick_tools.profiling`` logger, so production logs can
+    be aggregated across sessions. ``context`` (e.g. a session id) is added
+    to every record.
+    """
+
+    def __init__(self, context: Optional[Dict] = None):
+        self.context = dict(context or {})
+        self.records: List[Dict] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, stage: str, ticker: str = "*") -> Iterator[Dict]:
+        """Time a block. The yielded dict may be updated with ``rows``/``bytes``."""
+        record = {"stage": stage, "ticker": ticker, "rows": 0, "bytes": 0}
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - started
+            self.add(record)
+
+    def add(self, record: Dict) -> None:
+        record = {**self.context, **record}
+        with self._lock:
+            self.records.append(record)
+        logger.info(json.dumps(record, default=str))
+
+    def to_frame(self) -> pd.DataFrame:
+        """All records as a DataFrame (one row per stage call)."""
+        with self._lock:
+            records = list(self.records)
+        if not records:
+            return pd.DataFrame(columns=["stage", "ticker", "rows", "bytes", "seconds"])
+        return pd.DataFrame(records)
+
+    def summary(self) -> pd.DataFrame:
+        """Per-stage totals: calls, total/mean/max time, rows and bytes."""
+        df = self.to_frame()
+        if df.empty:
+            return pd.DataFrame(columns=["Stage", "Calls", "Total (s)", "Mean (ms)", "Max (ms)", "Rows", "Bytes"])
+        grouped = df.groupby("stage", sort=False)
+        summary = pd.DataFrame({
+            "Calls": grouped.size(),
+            "Total (s)": grouped["seconds"].sum().round(3),
+            "Mean (ms)": (grouped["seconds"].mean() * 1000).round(1),
+            "Max (ms)": (grouped["seconds"].max() * 1000).round(1),
+            "Rows": grouped["rows"].sum(),
+            "Bytes": grouped["bytes"].sum(),
+        })
+        return summary.rename_axis("Stage").reset_index()
+
+
+def profile_stage(profiler: Optional[PipelineProfiler], stage: str, ticker: str = "*"):
+    """``profiler.stage(...)``, or a no-op context when there is no profiler."""
+    if profiler is None:
+        # Same keys as a real record, so callers can increment rows/bytes
+        return nullcontext({"stage": stage, "ticker": ticker, "rows": 0, "bytes": 0})
+    return profiler.stage(stage, ticker)
+
+
+def frame_bytes(df: pd.DataFrame) -> int:
+    """In-memory size of a frame (used as the bytes figure for downloads)."""
+    return int(df.memory_usage(deep=True).sum())
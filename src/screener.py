@@ -1,17 +1,33 @@
+import uuid
 import streamlit as st
 import yfinance as yf
+import numpy as np
 import pandas as pd
 import ta
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, Tuple, Union
+from ohlcv_store import OHLCVStore
+from profiling import PipelineProfiler, frame_bytes, profile_stage
+from ticker_universe import get_universe
 
 
 # ---------------------------------------------------
 # Data Loader Class
 # ---------------------------------------------------
 class DataLoader:
-    """Handles downloading and basic data processing."""
+    """Handles downloading and basic data processing.
+    
+    With a ``store`` attached, ``load``/``load_many`` serve bars from the
+    local OHLCV store and only download the date ranges it is missing.
+    With a ``profiler`` attached, downloads and store access are timed.
+    """
+    
+    def __init__(self, store: Optional[OHLCVStore] = None, profiler: Optional[PipelineProfiler] = None):
+        self.store = store
+        self.profiler = profiler
     
     @staticmethod
     def download_data(ticker: str, start: datetime, end: datetime) -> pd.DataFrame:
@@ -24,6 +40,160 @@ class DataLoader:
         
         df.dropna(inplace=True)
         return df
+    
+    @staticmethod
+    def download_many(
+        tickers: List[str], start: datetime, end: datetime, max_workers: int = 8,
+        profiler: Optional[PipelineProfiler] = None
+    ) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Exception]]:
+        """Download OHLCV data for several tickers at once.
+        
+        Tries a single multi-symbol request first, then fetches whatever it
+        did not return on a bounded thread pool. Returns (frames, errors)
+        so one bad ticker never fails the rest.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        frames, errors = {}, {}
+        
+        if len(tickers) > 1:
+            try:
+                with profile_stage(profiler, "download_batch") as record:
+                    batch = yf.download(
+                        tickers, start=start, end=end, group_by="ticker",
+                        threads=max_workers, progress=False
+                    )
+                    record["rows"], record["bytes"] = len(batch), frame_bytes(batch)
+                if isinstance(batch.columns, pd.MultiIndex):
+                    available = set(batch.columns.get_level_values(0))
+                    for ticker in tickers:
+                        if ticker in available:
+                            df = batch[ticker].dropna()
+                            if not df.empty:
+                                frames[ticker] = df
+            except Exception:
+                # Fall back to per-ticker downloads below
+                pass
+        
+        def fetch(ticker: str) -> pd.DataFrame:
+            with profile_stage(profiler, "download", ticker) as record:
+                df = DataLoader.download_data(ticker, start, end)
+                record["rows"], record["bytes"] = len(df), frame_bytes(df)
+            return df
+        
+        missing = [t for t in tickers if t not in frames]
+        if missing:
+            workers = max(1, min(max_workers, len(missing)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(fetch, t): t for t in missing}
+                for future in as_completed(futures):
+                    ticker = futures[future]
+                    try:
+                        frames[ticker] = future.result()
+                    except Exception as e:
+                        errors[ticker] = e
+        
+        return frames, errors
+    
+    def load(self, ticker: str, start: datetime, end: datetime) -> pd.DataFrame:
+        """Load OHLCV data for one ticker, using the store when available."""
+        frames, errors = self.load_many([ticker], start, end, max_workers=1)
+        if ticker in errors:
+            raise errors[ticker]
+        return frames[ticker]
+    
+    def load_many(
+        self, tickers: List[str], start: datetime, end: datetime, max_workers: int = 8
+    ) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Exception]]:
+        """Like ``download_many`` but only fetches ranges missing from the store."""
+        if self.store is None:
+            return self.download_many(tickers, start, end, max_workers, self.profiler)
+        
+        tickers = list(dict.fromkeys(tickers))
+        errors, readjusted = self._fill_gaps(tickers, start, end, max_workers)
+        if readjusted:
+            # The store dropped their older, differently adjusted bars
+            more_errors, _ = self._fill_gaps(readjusted, start, end, max_workers)
+            errors.update(more_errors)
+        
+        frames = {}
+        for ticker in tickers:
+            if ticker in errors:
+                continue
+            with profile_stage(self.profiler, "store_read", ticker) as record:
+                frames[ticker] = self.store.read(ticker, start, end)
+                record["rows"], record["bytes"] = len(frames[ticker]), frame_bytes(frames[ticker])
+        return frames, errors
+    
+    def _fill_gaps(
+        self, tickers: List[str], start: datetime, end: datetime, max_workers: int
+    ) -> Tuple[Dict[str, Exception], List[str]]:
+        """Download and store the ranges the store is missing.
+        
+        Returns the download and store errors per ticker, and the tickers
+        whose stored history was dropped because the new bars were adjusted
+        differently.
+        """
+        # Group tickers by identical missing range so each gap is one batch
+        gaps = {}
+        with profile_stage(self.profiler, "store_lookup") as record:
+            for ticker in tickers:
+                for gap in self.store.missing_ranges(ticker, start, end):
+                    gaps.setdefault(gap, []).append(ticker)
+            record["rows"] = len(tickers)
+        
+        errors, readjusted = {}, []
+        for (gap_start, gap_end), group in gaps.items():
+            fetched, failed = self.download_many(group, gap_start, gap_end, max_workers, self.profiler)
+            errors.update(failed)
+            with profile_stage(self.profiler, "store_write") as record:
+                for ticker in group:
+                    if ticker not in fetched:
+                        continue
+                    # A bad frame (e.g. missing OHLCV columns) fails only its own ticker
+                    try:
+                        if not self.store.write(ticker, fetched[ticker], gap_start, gap_end):
+                            readjusted.append(ticker)
+                    except Exception as e:
+                        errors[ticker] = e
+                        continue
+                    record["rows"] += len(fetched[ticker])
+        return errors, list(dict.fromkeys(readjusted))
+
+
+# Candidate chart bar sizes, finest first, with their approximate width
+CHART_RESOLUTIONS = [
+    ("5min", pd.Timedelta(minutes=5)),
+    ("15min", pd.Timedelta(minutes=15)),
+    ("1h", pd.Timedelta(hours=1)),
+    ("1D", pd.Timedelta(days=1)),
+    ("W", pd.Timedelta(days=7)),
+    ("MS", pd.Timedelta(days=30)),
+    ("QS", pd.Timedelta(days=91)),
+]
+RESOLUTION_LABELS = {
+    "5min": "5-minute", "15min": "15-minute", "1h": "Hourly",
+    "1D": "Daily", "W": "Weekly", "MS": "Monthly", "QS": "Quarterly",
+}
+
+def load_universe(sectors: Optional[Iterable[str]] = None) -> List[str]:
+    """Return the packaged S&P 500 constituents, optionally only those in ``sectors``."""
+    universe = get_universe()
+    symbols = universe.from_source("sp500")
+    if sectors:
+        sectors = set(sectors)
+        symbols = [s for s in symbols if universe.get(s)["Sector"] in sectors]
+    return symbols
+
+
+_default_store = None
+
+
+def get_default_store() -> OHLCVStore:
+    """Return the process-wide OHLCV store (created on first use)."""
+    global _default_store
+    if _default_store is None:
+        _default_store = OHLCVStore()
+    return _default_store
 
 
 # ---------------------------------------------------
@@ -58,6 +228,328 @@ class IndicatorCalculator:
         
         df.dropna(inplace=True)
         return df
+    
+    @staticmethod
+    def build_panel(frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """Align per-ticker OHLCV frames into one wide frame per field (one column per ticker)."""
+        return {
+            field: pd.DataFrame({ticker: df[field] for ticker, df in frames.items()})
+            for field in ["Open", "High", "Low", "Close", "Volume"]
+        }
+    
+    @staticmethod
+    def compute_panel(panel: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """Compute EMA-21, RSI-14, VWAP and ATR-14 for every ticker of a panel at once.
+        
+        Mirrors ``add_indicators`` (and the ``ta`` formulas it uses) column by
+        column, so values match to floating-point rounding. Rows where a ticker
+        has no bar are skipped exactly as if that ticker's frame had been
+        processed on its own.
+        """
+        close_df = panel["Close"]
+        high, low, close, volume = (
+            panel[field].to_numpy(dtype=float) for field in ("High", "Low", "Close", "Volume")
+        )
+        valid = ~(np.isnan(high) | np.isnan(low) | np.isnan(close) | np.isnan(volume))
+        
+        # Pack each column's valid rows to the top so holidays / late listings
+        # never leave gaps inside a series; padding ends up at the bottom.
+        order = np.argsort(~valid, axis=0, kind="stable")
+        padding = np.arange(len(close))[:, None] >= valid.sum(axis=0)
+        
+        def pack(values: np.ndarray) -> np.ndarray:
+            packed = np.take_along_axis(values, order, axis=0)
+            packed[padding] = np.nan
+            return packed
+        
+        def unpack(values: np.ndarray) -> pd.DataFrame:
+            out = np.full(values.shape, np.nan)
+            np.put_along_axis(out, order, values, axis=0)
+            out[~valid] = np.nan
+            return pd.DataFrame(out, index=close_df.index, columns=close_df.columns)
+        
+        h, l, c, v = pack(high), pack(low), pack(close), pack(volume)
+        c_df = pd.DataFrame(c)
+        
+        # EMA
+        ema = c_df.ewm(span=21, adjust=False).mean().to_numpy()
+        
+        # RSI (Wilder smoothing, as in ta.momentum.RSIIndicator)
+        diff = c_df.diff(1)
+        up = diff.where(diff > 0, 0.0)
+        down = -diff.where(diff < 0, 0.0)
+        ema_up = up.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+        ema_down = down.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+        rsi = np.where(ema_down == 0, 100, 100 - (100 / (1 + ema_up / ema_down)))
+        
+        # VWAP (rolling 14, as in ta.volume.VolumeWeightedAveragePrice)
+        typical_price = (h + l + c) / 3.0
+        total_pv = pd.DataFrame(typical_price * v).rolling(14, min_periods=14).sum()
+        total_volume = pd.DataFrame(v).rolling(14, min_periods=14).sum()
+        vwap = (total_pv / total_volume).to_numpy()
+        
+        # ATR (as in ta.volatility.AverageTrueRange)
+        prev_close = np.vstack([np.full((1, c.shape[1]), np.nan), c[:-1]])
+        true_range = np.fmax(np.fmax(h - l, np.abs(h - prev_close)), np.abs(l - prev_close))
+        atr = np.full(c.shape, np.nan)
+        if len(c) >= 14:
+            atr[:13] = 0.0
+            atr[13] = np.ascontiguousarray(true_range[:14].T).sum(axis=1) / 14.0
+            for i in range(14, len(c)):
+                atr[i] = (atr[i - 1] * 13 + true_range[i]) / 14.0
+        
+        return {
+            "EMA_21": unpack(ema),
+            "RSI_14": unpack(rsi),
+            "VWAP": unpack(vwap),
+            "ATR_14": unpack(atr),
+        }
+    
+    @staticmethod
+    def add_indicators_panel(frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """Panel equivalent of ``add_indicators`` for a dict of per-ticker frames."""
+        if not frames:
+            return {}
+        indicators = IndicatorCalculator.compute_panel(IndicatorCalculator.build_panel(frames))
+        
+        results = {}
+        for ticker, df in frames.items():
+            df = df.copy()
+            for name, values in indicators.items():
+                df[name] = values[ticker].reindex(df.index)
+            df.dropna(inplace=True)
+            results[ticker] = df
+        return results
+
+
+# ---------------------------------------------------
+# Streaming Indicator State Classes
+# ---------------------------------------------------
+def _ewm_step(prev: float, value: float, alpha: float) -> float:
+    """One ``ewm(adjust=False)`` step, written the way pandas evaluates it."""
+    old_wt, new_wt = 1.0 - alpha, alpha
+    return (old_wt * prev + new_wt * value) / (old_wt + new_wt)
+
+
+class EMAState:
+    """Exponential moving average of close, updated one bar at a time."""
+    
+    def __init__(self, span: int = 21):
+        self.span = span
+        self.value = None
+    
+    def update(self, close: float) -> Optional[float]:
+        if self.value is None:
+            self.value = close
+        else:
+            self.value = _ewm_step(self.value, close, 2.0 / (self.span + 1))
+        return self.value
+    
+    def to_dict(self) -> Dict:
+        return {"span": self.span, "value": self.value}
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "EMAState":
+        state = cls(data["span"])
+        state.value = data["value"]
+        return state
+
+
+class RSIState:
+    """RSI with Wilder smoothing, updated one bar at a time."""
+    
+    def __init__(self, window: int = 14):
+        self.window = window
+        self.prev_close = None
+        self.avg_up = None
+        self.avg_down = None
+        self.count = 0
+    
+    def update(self, close: float) -> Optional[float]:
+        diff = 0.0 if self.prev_close is None else close - self.prev_close
+        up, down = max(diff, 0.0), max(-diff, 0.0)
+        alpha = 1.0 / self.window
+        if self.avg_up is None:
+            self.avg_up, self.avg_down = up, down
+        else:
+            self.avg_up = _ewm_step(self.avg_up, up, alpha)
+            self.avg_down = _ewm_step(self.avg_down, down, alpha)
+        self.prev_close = close
+        self.count += 1
+        return self.value
+    
+    @property
+    def value(self) -> Optional[float]:
+        if self.count < self.window:
+            return None
+        if self.avg_down == 0:
+            return 100.0
+        return 100 - (100 / (1 + self.avg_up / self.avg_down))
+    
+    def to_dict(self) -> Dict:
+        return {
+            "window": self.window, "prev_close": self.prev_close,
+            "avg_up": self.avg_up, "avg_down": self.avg_down, "count": self.count,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RSIState":
+        state = cls(data["window"])
+        state.prev_close = data["prev_close"]
+        state.avg_up = data["avg_up"]
+        state.avg_down = data["avg_down"]
+        state.count = data["count"]
+        return state
+
+
+class VWAPState:
+    """Rolling-window VWAP over the last ``window`` bars."""
+    
+    def __init__(self, window: int = 14):
+        self.window = window
+        self.price_volume = []
+        self.volume = []
+    
+    def update(self, high: float, low: float, close: float, volume: float) -> Optional[float]:
+        typical_price = (high + low + close) / 3.0
+        self.price_volume.append(typical_price * volume)
+        self.volume.append(volume)
+        if len(self.volume) > self.window:
+            self.price_volume.pop(0)
+            self.volume.pop(0)
+        return self.value
+    
+    @property
+    def value(self) -> Optional[float]:
+        # Summing a fixed-size window is O(window) = O(1) and avoids the
+        # drift a running add/subtract total accumulates over many bars.
+        if len(self.volume) < self.window:
+            return None
+        return sum(self.price_volume) / sum(self.volume)
+    
+    def to_dict(self) -> Dict:
+        return {"window": self.window, "price_volume": self.price_volume, "volume": self.volume}
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "VWAPState":
+        state = cls(data["window"])
+        state.price_volume = list(data["price_volume"])
+        state.volume = list(data["volume"])
+        return state
+
+
+class ATRState:
+    """Average true range with Wilder smoothing, updated one bar at a time."""
+    
+    def __init__(self, window: int = 14):
+        self.window = window
+        self.prev_close = None
+        self.seed = []  # true ranges until the first full window
+        self.value = None
+    
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        true_range = high - low
+        if self.prev_close is not None:
+            true_range = max(true_range, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+        
+        if self.value is None:
+            self.seed.append(true_range)
+            if len(self.seed) == self.window:
+                self.value = sum(self.seed) / float(self.window)
+                self.seed = []
+        else:
+            self.value = (self.value * (self.window - 1) + true_range) / float(self.window)
+        return self.value
+    
+    def to_dict(self) -> Dict:
+        return {"window": self.window, "prev_close": self.prev_close, "seed": self.seed, "value": self.value}
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ATRState":
+        state = cls(data["window"])
+        state.prev_close = data["prev_close"]
+        state.seed = list(data["seed"])
+        state.value = data["value"]
+        return state
+
+
+class StreamingIndicators:
+    """Stateful EMA-21, RSI-14, VWAP and ATR-14 that update in O(1) per new bar.
+    
+    Seed once from history with ``from_history``, then feed only new bars via
+    ``update``/``update_frame``. ``to_dict``/``from_dict`` give a JSON-safe
+    form that can be saved next to the cached OHLCV data
+    (see ``OHLCVStore.save_indicator_state``).
+    """
+    
+    def __init__(self):
+        self.ema = EMAState(21)
+        self.rsi = RSIState(14)
+        self.vwap = VWAPState(14)
+        self.atr = ATRState(14)
+        self.last_timestamp = None
+    
+    @classmethod
+    def from_history(cls, df: pd.DataFrame) -> "StreamingIndicators":
+        """Build the state by replaying an OHLCV frame."""
+        state = cls()
+        state.update_frame(df)
+        return state
+    
+    def update(self, high: float, low: float, close: float, volume: float,
+               timestamp: Optional[datetime] = None) -> Dict[str, float]:
+        """Apply one new bar and return the latest indicator values."""
+        self.ema.update(close)
+        self.rsi.update(close)
+        self.vwap.update(high, low, close, volume)
+        self.atr.update(high, low, close)
+        if timestamp is not None:
+            self.last_timestamp = pd.Timestamp(timestamp)
+        return self.values()
+    
+    def update_frame(self, df: pd.DataFrame) -> Dict[str, float]:
+        """Apply the bars of ``df`` that are newer than the last one seen."""
+        if self.last_timestamp is not None:
+            df = df[df.index > self.last_timestamp]
+        columns = df[["High", "Low", "Close", "Volume"]].astype(float)
+        for timestamp, (high, low, close, volume) in zip(
+            columns.index, columns.itertuples(index=False, name=None)
+        ):
+            self.update(high, low, close, volume, timestamp)
+        return self.values()
+    
+    def values(self) -> Dict[str, float]:
+        """Latest indicator values (NaN until each indicator has enough bars)."""
+        def _or_nan(value: Optional[float]) -> float:
+            return np.nan if value is None else value
+        
+        return {
+            "EMA_21": _or_nan(self.ema.value),
+            "RSI_14": _or_nan(self.rsi.value),
+            "VWAP": _or_nan(self.vwap.value),
+            "ATR_14": _or_nan(self.atr.value),
+        }
+    
+    def to_dict(self) -> Dict:
+        return {
+            "ema": self.ema.to_dict(),
+            "rsi": self.rsi.to_dict(),
+            "vwap": self.vwap.to_dict(),
+            "atr": self.atr.to_dict(),
+            "last_timestamp": None if self.last_timestamp is None else self.last_timestamp.isoformat(),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "StreamingIndicators":
+        state = cls()
+        state.ema = EMAState.from_dict(data["ema"])
+        state.rsi = RSIState.from_dict(data["rsi"])
+        state.vwap = VWAPState.from_dict(data["vwap"])
+        state.atr = ATRState.from_dict(data["atr"])
+        if data.get("last_timestamp"):
+            state.last_timestamp = pd.Timestamp(data["last_timestamp"])
+        return state
 
 
 # ---------------------------------------------------
@@ -66,9 +558,13 @@ class IndicatorCalculator:
 class RecommendationEngine:
     """Generates trading recommendations based on indicators."""
     
+    BULLISH = "Bullish Setup"
+    NEUTRAL = "Neutral"
+    BEARISH = "Bearish/Weak Setup"
+    
     @staticmethod
-    def get_recommendation(row: pd.Series) -> str:
-        """Generate recommendation based on technical indicators."""
+    def get_score(row: pd.Series) -> int:
+        """Score a single row from 0 (weak) to 4 (strong)."""
         score = 0
         
         if row["Close"] > row["EMA_21"]:
@@ -80,52 +576,182 @@ class RecommendationEngine:
         if (row["ATR_14"] / row["Close"]) < 0.06:
             score += 1
         
+        return score
+    
+    @staticmethod
+    def get_recommendation(row: pd.Series) -> str:
+        """Generate recommendation based on technical indicators."""
+        score = RecommendationEngine.get_score(row)
+        
         if score >= 3:
-            return "Bullish Setup"
+            return RecommendationEngine.BULLISH
         elif score <= 1:
-            return "Bearish/Weak Setup"
+            return RecommendationEngine.BEARISH
         else:
-            return "Neutral"
+            return RecommendationEngine.NEUTRAL
+    
+    @staticmethod
+    def score(close, ema, rsi, vwap, atr):
+        """Vectorized version of the ``get_recommendation`` score (0-4).
+        
+        Accepts Series (every bar of one ticker) or aligned wide DataFrames
+        (every bar of every ticker) and returns the same shape.
+        """
+        return (
+            (close > ema).astype(int)
+            + ((rsi > 30) & (rsi < 60)).astype(int)
+            + (close > vwap).astype(int)
+            + ((atr / close) < 0.06).astype(int)
+        )
+    
+    @staticmethod
+    def label(score):
+        """Map scores to Bullish/Neutral/Bearish labels, keeping the input shape."""
+        labels = np.select(
+            [score >= 3, score <= 1],
+            [RecommendationEngine.BULLISH, RecommendationEngine.BEARISH],
+            default=RecommendationEngine.NEUTRAL
+        )
+        if isinstance(score, pd.DataFrame):
+            return pd.DataFrame(labels, index=score.index, columns=score.columns)
+        return pd.Series(labels, index=score.index)
+    
+    @staticmethod
+    def get_recommendations(df: pd.DataFrame) -> pd.Series:
+        """Label every bar of an indicator frame (output of ``add_indicators``)."""
+        return RecommendationEngine.label(RecommendationEngine.score(
+            df["Close"], df["EMA_21"], df["RSI_14"], df["VWAP"], df["ATR_14"]
+        ))
+    
+    @staticmethod
+    def get_recommendations_panel(close: pd.DataFrame, indicators: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """Label every bar of every ticker from a close panel and ``compute_panel`` output.
+        
+        Cells where an indicator is not available yet are left as None.
+        """
+        labels = RecommendationEngine.label(RecommendationEngine.score(
+            close, indicators["EMA_21"], indicators["RSI_14"], indicators["VWAP"], indicators["ATR_14"]
+        ))
+        available = close.notna()
+        for values in indicators.values():
+            available &= values.notna()
+        return labels.where(available, None)
+    
+    @staticmethod
+    def backtest(frames: Union[Dict[str, pd.DataFrame], Iterable[pd.DataFrame]],
+                 horizon: int = 5) -> pd.DataFrame:
+        """Forward returns and hit rates per signal class.
+        
+        Every bar of every indicator frame is labelled and paired with the
+        close-to-close return ``horizon`` bars later. "Win Rate" is the share
+        of positive forward returns; "Hit Rate" is the share that moved in the
+        signal's direction (up for Bullish, down for Bearish). ``frames`` may
+        be a dict or any iterable of frames (e.g. a generator, to avoid
+        holding every indicator frame at once).
+        """
+        if isinstance(frames, dict):
+            frames = frames.values()
+        parts = []
+        for df in frames:
+            if df.empty:
+                continue
+            parts.append(pd.DataFrame({
+                "Signal": RecommendationEngine.get_recommendations(df),
+                "Forward Return": df["Close"].shift(-horizon) / df["Close"] - 1,
+            }))
+        
+        columns = ["Signal", "Bars", "Mean Return", "Median Return", "Win Rate", "Hit Rate"]
+        if not parts:
+            return pd.DataFrame(columns=columns)
+        
+        data = pd.concat(parts).dropna(subset=["Forward Return"])
+        forward = data["Forward Return"]
+        data["Win"] = (forward > 0).astype(float)
+        data["Hit"] = np.select(
+            [data["Signal"] == RecommendationEngine.BULLISH, data["Signal"] == RecommendationEngine.BEARISH],
+            [forward > 0, forward < 0],
+            default=np.nan
+        )
+        
+        grouped = data.groupby("Signal")
+        summary = pd.DataFrame({
+            "Bars": grouped.size(),
+            "Mean Return": grouped["Forward Return"].mean(),
+            "Median Return": grouped["Forward Return"].median(),
+            "Win Rate": grouped["Win"].mean(),
+            "Hit Rate": grouped["Hit"].mean(),
+        })
+        order = [RecommendationEngine.BULLISH, RecommendationEngine.NEUTRAL, RecommendationEngine.BEARISH]
+        summary = summary.reindex([s for s in order if s in summary.index])
+        return summary.rename_axis("Signal").reset_index()[columns]
 
 
 # ---------------------------------------------------
 # Stock Screener Class
 # ---------------------------------------------------
 class StockScreener:
-    """Main screener that processes tickers and generates results."""
+    """Main screener that processes tickers and generates results.
     
-    def __init__(self, tickers: List[str], start_date: datetime, end_date: datetime, debug: bool = False):
+    With ``compact=True`` the screener keeps only one float32 OHLCV frame per
+    ticker (stored as-is, never copied - treat it as read-only) and computes
+    indicator frames on demand via ``get_indicator_frame`` instead of keeping
+    one per ticker.
+    """
+    
+    def __init__(self, tickers: List[str], start_date: datetime, end_date: datetime, debug: bool = False,
+                 max_workers: int = 8, store: Optional[OHLCVStore] = None, compact: bool = False):
         self.tickers = tickers
         self.start_date = start_date
         self.end_date = end_date
         self.debug = debug
-        self.data_loader = DataLoader()
+        self.max_workers = max_workers
+        self.compact = compact
+        self.profiler = PipelineProfiler()
+        self.data_loader = DataLoader(store if store is not None else get_default_store(), self.profiler)
         self.indicator_calc = IndicatorCalculator()
         self.recommendation_engine = RecommendationEngine()
         self.results = []
         self.ticker_data = {}  # Store raw data for charting
+        self.indicator_data = {}  # Store indicator frames for backtesting
+        self.errors = {}  # Ticker -> error message, rendered by show_diagnostics
+        self._lazy_indicators = None  # (ticker, frame) last computed in compact mode
+    
+    @staticmethod
+    def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Return just the OHLCV columns as float32 (half the memory of float64)."""
+        return df[["Open", "High", "Low", "Close", "Volume"]].astype("float32")
     
-    def process_ticker(self, ticker: str) -> Dict:
-        """Process a single ticker and return results."""
+    def process_ticker(self, ticker: str, df: Optional[pd.DataFrame] = None,
+                       indicator_df: Optional[pd.DataFrame] = None) -> Dict:
+        """Process a single ticker and return results.
+        
+        If ``df`` is given (e.g. prefetched by ``run``) it is used instead of
+        downloading the ticker again; likewise ``indicator_df`` skips the
+        per-ticker indicator calculation.
+        """
         try:
             # Download data
-            df = self.data_loader.download_data(ticker, self.start_date, self.end_date)
+            if df is None:
+                df = self.data_loader.load(ticker, self.start_date, self.end_date)
+                if self.compact:
+                    df = self.compact_frame(df)
             
-            # Store raw data for later charting
-            self.ticker_data[ticker] = df.copy()
+            raw = df
             
             # Add indicators
-            df = self.indicator_calc.add_indicators(df)
+            if indicator_df is None:
+                with profile_stage(self.profiler, "indicators", ticker) as record:
+                    df = self.indicator_calc.add_indicators(df)
+                    record["rows"] = len(df)
+            else:
+                df = indicator_df
             latest = df.iloc[-1]
             
             # Generate recommendation
-            rec = self.recommendation_engine.get_recommendation(latest)
-            
-            if self.debug:
-                with st.expander(f"Debug: {ticker}"):
-                    st.write("Columns:", df.columns.tolist())
-                    st.write("Shapes:", {col: df[col].shape for col in df.columns})
-                    st.write(df.tail())
+            with profile_stage(self.profiler, "recommendation", ticker) as record:
+                score = self.recommendation_engine.get_score(latest)
+                rec = self.recommendation_engine.get_recommendation(latest)
+                record["rows"] = 1
             
             result = {
                 "Ticker": ticker,
@@ -137,115 +763,480 @@ class StockScreener:
                 "RSI_14": round(latest["RSI_14"], 2),
                 "VWAP": round(latest["VWAP"], 2),
                 "ATR_14": round(latest["ATR_14"], 2),
+                "Score": score,
                 "Recommendation": rec
             }
             
+            # Keep frames for charting only once the ticker has screened successfully
+            self.ticker_data[ticker] = raw if self.compact else raw.copy()
+            if not self.compact:
+                self.indicator_data[ticker] = df
             return result
             
         except Exception as e:
-            st.error(f"Error processing {ticker}: {e}")
+            self.errors[ticker] = str(e)
             return None
     
-    def run(self) -> List[Dict]:
-        """Run screener on all tickers."""
-        for ticker in self.tickers:
-            result = self.process_ticker(ticker)
+    def _process_batch(self, tickers: List[str]) -> List[Dict]:
+        """Download, compute and score a batch of tickers; return its results."""
+        # Fetch everything up front (batched + concurrent), then process serially
+        frames, errors = self.data_loader.load_many(
+            tickers, self.start_date, self.end_date, self.max_workers
+        )
+        if self.compact:
+            frames = {ticker: self.compact_frame(df) for ticker, df in frames.items()}
+        
+        # Indicators for the whole batch in one vectorized pass
+        try:
+            with profile_stage(self.profiler, "indicators_panel") as record:
+                indicator_frames = self.indicator_calc.add_indicators_panel(frames)
+                record["rows"] = sum(len(df) for df in frames.values())
+        except Exception:
+            # Fall back to per-ticker calculation inside process_ticker
+            indicator_frames = {}
+        
+        batch_results = []
+        for ticker in tickers:
+            if ticker in errors:
+                self.errors[ticker] = str(errors[ticker])
+                continue
+            result = self.process_ticker(ticker, frames.get(ticker), indicator_frames.get(ticker))
             if result:
-                self.results.append(result)
+                batch_results.append(result)
         
+        self.results.extend(batch_results)
+        return batch_results
+    
+    def run(self) -> List[Dict]:
+        """Run screener on all tickers."""
+        self._process_batch(self.tickers)
         return self.results
     
+    def iter_scan(self, chunk_size: int = 50) -> Iterator[Tuple[int, int]]:
+        """Screen ``self.tickers`` chunk by chunk, yielding (done, total) after each.
+        
+        Results accumulate in ``self.results`` as chunks finish, so callers can
+        render partial rankings while the rest of the universe downloads.
+        """
+        total = len(self.tickers)
+        for start in range(0, total, chunk_size):
+            chunk = self.tickers[start:start + chunk_size]
+            self._process_batch(chunk)
+            yield min(start + chunk_size, total), total
+    
+    def scan(self, top_n: int = 20, rank_by: str = "Score", ascending: bool = False,
+             chunk_size: int = 50,
+             progress: Optional[Callable[[int, int, pd.DataFrame], None]] = None) -> pd.DataFrame:
+        """Screen every ticker and return the top ``top_n`` ranked results.
+        
+        ``progress(done, total, ranked_so_far)`` is called after each chunk.
+        """
+        for done, total in self.iter_scan(chunk_size):
+            if progress is not None:
+                progress(done, total, self.rank_results(self.results, top_n, rank_by, ascending))
+        return self.rank_results(self.results, top_n, rank_by, ascending)
+    
+    @staticmethod
+    def rank_results(results: List[Dict], top_n: int = 20, rank_by: str = "Score",
+                     ascending: bool = False) -> pd.DataFrame:
+        """Rank results by score, then by ``rank_by``, and keep the top N."""
+        df = pd.DataFrame(results)
+        if df.empty:
+            return df
+        
+        by, order = ["Score"], [False]
+        if rank_by != "Score":
+            by.append(rank_by)
+            order.append(ascending)
+        else:
+            order = [ascending]
+        return df.sort_values(by, ascending=order).head(top_n).reset_index(drop=True)
+    
+    def show_diagnostics(self) -> None:
+        """Render per-ticker errors (and debug details when enabled) in Streamlit."""
+        for ticker, error in self.errors.items():
+            st.error(f"Error processing {ticker}: {error}")
+        
+        if self.debug:
+            st.markdown("**⏱️ Pipeline timings**")
+            st.dataframe(self.profiler.summary(), use_container_width=True)
+            with st.expander("Per-ticker timings"):
+                st.dataframe(self.profiler.to_frame(), use_container_width=True)
+            
+            for ticker in (r["Ticker"] for r in self.results):
+                df = self.get_indicator_frame(ticker)
+                with st.expander(f"Debug: {ticker}"):
+                    st.write("Columns:", df.columns.tolist())
+                    st.write("Shapes:", {col: df[col].shape for col in df.columns})
+                    st.write(df.tail())
+    
+    def backtest(self, horizon: int = 5) -> pd.DataFrame:
+        """Backtest the recommendation rules over every processed ticker."""
+        with profile_stage(self.profiler, "backtest") as record:
+            record["rows"] = len(self.results)
+            if not self.compact:
+                return self.recommendation_engine.backtest(self.indicator_data, horizon)
+            frames = (self.get_indicator_frame(r["Ticker"]) for r in self.results)
+            return self.recommendation_engine.backtest(frames, horizon)
+    
+    def get_indicator_frame(self, ticker: str) -> pd.DataFrame:
+        """Return the OHLCV + indicator frame for a processed ticker.
+        
+        In compact mode it is computed on demand and only the most recently
+        requested frame is kept.
+        """
+        if ticker in self.indicator_data:
+            return self.indicator_data[ticker]
+        if self._lazy_indicators is None or self._lazy_indicators[0] != ticker:
+            with profile_stage(self.profiler, "indicators", ticker) as record:
+                frame = self.indicator_calc.add_indicators(self.ticker_data[ticker])
+                record["rows"] = len(frame)
+            self._lazy_indicators = (ticker, frame)
+        return self._lazy_indicators[1]
+    
+    def memory_usage(self) -> int:
+        """Approximate bytes held by this screener's frames."""
+        frames = list(self.ticker_data.values()) + list(self.indicator_data.values())
+        if self._lazy_indicators is not None:
+            frames.append(self._lazy_indicators[1])
+        return sum(int(df.memory_usage(deep=True).sum()) for df in frames)
+    
     @staticmethod
-    def create_ohlcv_chart(df: pd.DataFrame, ticker: str) -> go.Figure:
-        """Create an interactive OHLCV candlestick chart with volume."""
-        fig = go.Figure(data=[go.Candlestick(
-            x=df.index,
-            open=df['Open'],
-            high=df['High'],
-            low=df['Low'],
-            close=df['Close'],
-            name=ticker
-        )])
+    def choose_resolution(index: pd.DatetimeIndex, max_bars: int = 500) -> Optional[str]:
+        """Pick the finest bar size that keeps a chart at or under ``max_bars`` bars.
+        
+        Returns a pandas resample rule, or None when the native bars already fit.
+        """
+        if len(index) <= max_bars:
+            return None
+        span = index[-1] - index[0]
+        native_step = pd.Series(index).diff().median()
+        for rule, width in CHART_RESOLUTIONS:
+            if width > native_step and span / width <= max_bars:
+                return rule
+        return CHART_RESOLUTIONS[-1][0]
+    
+    @staticmethod
+    def resample_ohlcv(df: pd.DataFrame, rule: str) -> pd.DataFrame:
+        """Aggregate OHLCV bars to a coarser resolution (e.g. "W" or "MS")."""
+        agg = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+        agg = {col: how for col, how in agg.items() if col in df.columns}
+        return df.resample(rule).agg(agg).dropna(subset=["Close"])
+    
+    @staticmethod
+    def reduce_points(series: pd.Series, max_points: int = 1000) -> pd.Series:
+        """Min/max decimation for line traces: keeps each bucket's extremes."""
+        series = series.dropna()
+        if len(series) <= max_points:
+            return series
+        buckets = np.arange(len(series)) * (max_points // 2) // len(series)
+        grouped = pd.Series(series.to_numpy()).groupby(buckets)
+        keep = np.union1d(grouped.idxmin().to_numpy(), grouped.idxmax().to_numpy())
+        return series.iloc[keep]
+    
+    @staticmethod
+    def create_ohlcv_chart(df: pd.DataFrame, ticker: str, resolution: Optional[str] = "auto",
+                           max_bars: int = 500, webgl: bool = False, show_volume: bool = False,
+                           overlays: Optional[List[str]] = None,
+                           profiler: Optional[PipelineProfiler] = None) -> go.Figure:
+        """Create an interactive OHLCV candlestick chart with optional volume.
+        
+        Args:
+            resolution: "auto" picks the bar size from the visible range so at
+                most ``max_bars`` bars are sent; None keeps native bars; any
+                pandas rule ("W", "MS", ...) forces that bar size.
+            webgl: draw price as a WebGL close line instead of SVG candlesticks
+                (Plotly has no WebGL candlestick trace).
+            show_volume: add a volume subplot below the price pane.
+            overlays: extra columns of ``df`` (e.g. "EMA_21") drawn as
+                point-reduced lines.
+            profiler: optional PipelineProfiler that records a "chart" stage.
+        """
+        with profile_stage(profiler, "chart", ticker) as record:
+            fig = StockScreener._build_ohlcv_chart(df, ticker, resolution, max_bars, webgl, show_volume, overlays)
+            record["rows"] = len(df)
+        return fig
+    
+    @staticmethod
+    def _build_ohlcv_chart(df: pd.DataFrame, ticker: str, resolution: Optional[str], max_bars: int,
+                           webgl: bool, show_volume: bool, overlays: Optional[List[str]]) -> go.Figure:
+        rule = StockScreener.choose_resolution(df.index, max_bars) if resolution == "auto" else resolution
+        bars = StockScreener.resample_ohlcv(df, rule) if rule else df
+        scatter = go.Scattergl if webgl else go.Scatter
+        
+        if show_volume:
+            fig = make_subplots(rows=2, cols=1, shared_xaxes=True, row_heights=[0.75, 0.25],
+                                vertical_spacing=0.03)
+        else:
+            fig = go.Figure()
+        row_args = {"row": 1, "col": 1} if show_volume else {}
+        
+        if webgl:
+            close = StockScreener.reduce_points(df['Close'], max_bars * 2)
+            fig.add_trace(scatter(x=close.index, y=close, mode="lines", name=ticker), **row_args)
+        else:
+            fig.add_trace(go.Candlestick(
+                x=bars.index,
+                open=bars['Open'],
+                high=bars['High'],
+                low=bars['Low'],
+                close=bars['Close'],
+                name=ticker
+            ), **row_args)
+        
+        for column in overlays or []:
+            if column in df.columns:
+                line = StockScreener.reduce_points(df[column], max_bars * 2)
+                fig.add_trace(scatter(x=line.index, y=line, mode="lines", name=column), **row_args)
+        
+        if show_volume and "Volume" in bars.columns:
+            fig.add_trace(go.Bar(x=bars.index, y=bars['Volume'], name="Volume", showlegend=False),
+                          row=2, col=1)
+            fig.update_yaxes(title_text="Volume", row=2, col=1)
+        
+        title = f"{ticker} - OHLCV Chart"
+        if rule:
+            title += f" ({RESOLUTION_LABELS.get(rule, rule)} bars)"
         
         fig.update_layout(
-            title=f"{ticker} - OHLCV Chart",
+            title=title,
             yaxis_title="Stock Price (USD)",
             xaxis_title="Date",
             template="plotly_dark",
             xaxis_rangeslider_visible=False,
-            height=500,
+            height=650 if show_volume else 500,
             hovermode='x unified'
         )
         
         return fig
 
 
+# ---------------------------------------------------
+# Session Cache
+# ---------------------------------------------------
+SESSION_CACHE_KEY = "screener_cache"
+MAX_CACHED_SCREENS = 4
+
+
+def _screen_key(mode: str, tickers: List[str], start_date: datetime, end_date: datetime,
+                compact: bool) -> Tuple:
+    return mode, tuple(tickers), str(start_date), str(end_date), compact
+
+
+def get_cached_screener(mode: str, tickers: List[str], start_date: datetime,
+                        end_date: datetime, compact: bool = False) -> Optional[StockScreener]:
+    """Return this session's already-run screener for the given inputs, if any."""
+    cache = st.session_state.get(SESSION_CACHE_KEY, {})
+    return cache.get(_screen_key(mode, tickers, start_date, end_date, compact))
+
+
+def cache_screener(mode: str, screener: StockScreener) -> None:
+    """Memoize a finished screener run for this session (oldest entries evicted)."""
+    cache = st.session_state.setdefault(SESSION_CACHE_KEY, {})
+    key = _screen_key(mode, screener.tickers, screener.start_date, screener.end_date, screener.compact)
+    cache.pop(key, None)
+    cache[key] = screener
+    while len(cache) > MAX_CACHED_SCREENS:
+        cache.pop(next(iter(cache)))
+
+
+def clear_screener_cache() -> None:
+    """Drop every memoized screener run for this session."""
+    st.session_state.pop(SESSION_CACHE_KEY, None)
+
+
+def session_memory_usage() -> int:
+    """Approximate bytes held by this session's memoized screener runs."""
+    cache = st.session_state.get(SESSION_CACHE_KEY, {})
+    return sum(screener.memory_usage() for screener in cache.values())
+
+
 # ---------------------------------------------------
 # Streamlit App
 # ---------------------------------------------------
-def main():
-    """Main Streamlit application."""
-    st.set_page_config(page_title="Simple Multi-Stock Screener", layout="wide")
-    st.title("📈 Simple Multi-Stock Screener")
+def render_screener_page():
+    """Render the screener sidebar, results and charts.
     
-    # Sidebar Inputs
-    tickers_input = st.sidebar.text_input(
-        "Tickers (comma-separated)",
-        value="AAPL, MSFT, TSLA, AMZN"
+    Shared by the standalone app (``main``) and the dashboard's screener page.
+    Finished runs are memoized per session, so switching the chart ticker or
+    opening an expander does not download or recompute anything.
+    """
+    st.sidebar.markdown("### Stock Screener Settings")
+    mode = st.sidebar.radio(
+        "Mode", ["Ticker list", "Scan universe"], horizontal=True, key="screener_mode"
     )
     
+    universe = get_universe()
+    if mode == "Ticker list":
+        tickers_input = st.sidebar.text_input(
+            "Tickers (comma-separated)",
+            value="AAPL, MSFT, TSLA, AMZN, NVDA, GOOG, META, PLTR, WMT, AMD",
+            key="screener_tickers"
+        )
+        tickers = [t.strip().upper() for t in tickers_input.split(",") if t.strip()]
+        
+        def add_sector():
+            current = [t.strip().upper() for t in st.session_state["screener_tickers"].split(",") if t.strip()]
+            sector_tickers = universe.in_sector(st.session_state["screener_add_sector"])
+            st.session_state["screener_tickers"] = ", ".join(dict.fromkeys(current + sector_tickers))
+        
+        col_sector, col_add = st.sidebar.columns([3, 1])
+        col_sector.selectbox("Sector", universe.sector_names, key="screener_add_sector",
+                             label_visibility="collapsed")
+        col_add.button("Add", key="screener_add_sector_button", on_click=add_sector,
+                       help="Add every ticker in this sector to the list")
+        unknown = [t for t in tickers if t not in universe]
+        if unknown:
+            st.sidebar.caption(f"Not in the packaged universe (still screened): {', '.join(unknown)}")
+    else:
+        sectors = st.sidebar.multiselect(
+            "Sectors (all if empty)", [s for s in universe.sector_names if s not in ("ETF", "Index")],
+            key="screener_sectors"
+        )
+        tickers = load_universe(sectors)
+        top_n = st.sidebar.slider("Top N", min_value=5, max_value=100, value=20, key="screener_top_n")
+        rank_by = st.sidebar.selectbox(
+            "Rank by (after Score)",
+            ["Score", "RSI_14", "ATR_14", "Close", "EMA_21", "VWAP"],
+            key="screener_rank_by"
+        )
+        ascending = st.sidebar.checkbox("Ascending", value=False, key="screener_ascending")
+    
     start_date = st.sidebar.date_input(
         "Start Date",
-        value=datetime.today() - timedelta(days=365)
+        value=datetime.today() - timedelta(days=365),
+        key="screener_start"
     )
     
     end_date = st.sidebar.date_input(
         "End Date",
-        value=datetime.today()
+        value=datetime.today(),
+        key="screener_end"
     )
     
-    debug = st.sidebar.checkbox("Debug Mode", value=False)
+    max_workers = st.sidebar.slider(
+        "Max concurrent downloads", min_value=1, max_value=32, value=8, key="screener_workers"
+    )
     
-    tickers = [t.strip().upper() for t in tickers_input.split(",") if t.strip()]
+    backtest = st.sidebar.checkbox("Backtest Signals", value=False, key="screener_backtest")
+    horizon = st.sidebar.slider(
+        "Backtest horizon (bars)", min_value=1, max_value=60, value=5, key="screener_horizon",
+        disabled=not backtest
+    )
     
-    # Run Screener
-    if tickers:
-        screener = StockScreener(tickers, start_date, end_date, debug)
-        results = screener.run()
-        
-        # Display Results
-        if results:
-            st.subheader("📊 Screener Results")
-            st.info("Click on a ticker below to view its OHLCV chart")
-            
-            results_df = pd.DataFrame(results)
-            st.dataframe(results_df, use_container_width=True)
+    compact = st.sidebar.checkbox(
+        "Compact memory mode", value=False, key="screener_compact",
+        help="float32 prices, no per-ticker copies, indicators computed only when charted"
+    )
+    
+    debug = st.sidebar.checkbox("Debug Mode", value=False, key="screener_debug")
+    
+    if st.sidebar.button("🔄 Refresh Data", key="screener_refresh"):
+        clear_screener_cache()
+    if st.sidebar.button("🗑️ Clear Stored Prices", key="screener_clear_store",
+                         help="Delete the on-disk price history and download it again"):
+        get_default_store().clear()
+        clear_screener_cache()
+    
+    if not tickers:
+        st.warning("Please enter at least one ticker.")
+        return
+    
+    # Run Screener (or reuse this session's previous run for the same inputs)
+    screener = get_cached_screener(mode, tickers, start_date, end_date, compact)
+    if screener is None:
+        screener = StockScreener(tickers, start_date, end_date, debug, max_workers, compact=compact)
+        screener.profiler.context["session"] = st.session_state.setdefault("profiling_session", uuid.uuid4().hex[:12])
+        if mode == "Ticker list":
+            screener.run()
+        else:
+            progress_bar = st.progress(0.0, text=f"Scanning {len(tickers)} tickers...")
+            partial_table = st.empty()
             
-            # Ticker selection for detailed chart view
-            st.subheader("📈 Detailed Chart View")
-            selected_ticker = st.selectbox(
-                "Select a ticker to view detailed OHLCV chart:",
-                options=[r["Ticker"] for r in results],
-                key="ticker_selector"
-            )
+            def show_progress(done, total, ranked):
+                progress_bar.progress(done / total, text=f"Scanned {done}/{total} tickers")
+                partial_table.dataframe(ranked, use_container_width=True)
             
-            if selected_ticker and selected_ticker in screener.ticker_data:
-                df_chart = screener.ticker_data[selected_ticker]
-                
-                # Create and display candlestick chart
-                fig = screener.create_ohlcv_chart(df_chart, selected_ticker)
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Display OHLCV data table
-                with st.expander("📋 View Raw OHLCV Data"):
-                    display_df = df_chart[['Open', 'High', 'Low', 'Close', 'Volume']].copy()
-                    display_df = display_df.round(2)
-                    st.dataframe(display_df, use_container_width=True)
-        else:
-            st.warning("No data available. Check tickers or date range.")
+            screener.scan(top_n, rank_by, ascending, progress=show_progress)
+            progress_bar.empty()
+            partial_table.empty()
+        cache_screener(mode, screener)
+    
+    screener.debug = debug
+    screener.show_diagnostics()
+    st.sidebar.caption(
+        f"Session memory: {session_memory_usage() / 1024 ** 2:.1f} MB "
+        f"(this run: {screener.memory_usage() / 1024 ** 2:.1f} MB)"
+    )
+    
+    if mode == "Ticker list":
+        results = screener.results
     else:
-        st.warning("Please enter at least one ticker.")
+        results = screener.rank_results(screener.results, top_n, rank_by, ascending).to_dict("records")
+    
+    # Display Results
+    if not results:
+        st.warning("No data available. Check tickers or date range.")
+        return
+    
+    st.subheader("📊 Screener Results")
+    st.info("Click on a ticker below to view its OHLCV chart")
+    
+    results_df = pd.DataFrame(results)
+    st.dataframe(results_df, use_container_width=True)
+    
+    if backtest:
+        st.subheader(f"🧪 Signal Backtest ({horizon}-bar forward returns)")
+        backtest_df = screener.backtest(horizon)
+        st.dataframe(
+            backtest_df.style.format({
+                "Mean Return": "{:.2%}", "Median Return": "{:.2%}",
+                "Win Rate": "{:.1%}", "Hit Rate": "{:.1%}"
+            }, na_rep="-"),
+            use_container_width=True
+        )
+    
+    # Ticker selection for detailed chart view
+    st.subheader("📈 Detailed Chart View")
+    selected_ticker = st.selectbox(
+        "Select a ticker to view detailed OHLCV chart:",
+        options=[r["Ticker"] for r in results],
+        key="screener_ticker_selector"
+    )
+    
+    with st.expander("⚙️ Chart Options"):
+        resolution_options = {"Auto": "auto", "Native": None, "Daily": "1D", "Weekly": "W", "Monthly": "MS"}
+        resolution = st.selectbox("Bar resolution", list(resolution_options), key="screener_chart_resolution")
+        overlays = st.multiselect("Overlays", ["EMA_21", "VWAP"], key="screener_chart_overlays")
+        show_volume = st.checkbox("Show volume", value=False, key="screener_chart_volume")
+        webgl = st.checkbox("WebGL line mode (fastest for long ranges)", value=False, key="screener_chart_webgl")
+    
+    if selected_ticker and selected_ticker in screener.ticker_data:
+        df_chart = screener.ticker_data[selected_ticker]
+        
+        # Create and display candlestick chart
+        plot_df = df_chart
+        if overlays:
+            plot_df = df_chart.join(screener.get_indicator_frame(selected_ticker)[overlays])
+        fig = screener.create_ohlcv_chart(
+            plot_df, selected_ticker, resolution=resolution_options[resolution],
+            webgl=webgl, show_volume=show_volume, overlays=overlays, profiler=screener.profiler
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Display OHLCV data table
+        with st.expander("📋 View Raw OHLCV Data"):
+            display_df = df_chart[['Open', 'High', 'Low', 'Close', 'Volume']].copy()
+            display_df = display_df.round(2)
+            st.dataframe(display_df, use_container_width=True)
+
+
+def main():
+    """Main Streamlit application."""
+    st.set_page_config(page_title="Simple Multi-Stock Screener", layout="wide")
+    st.title("📈 Simple Multi-Stock Screener")
+    render_screener_page()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,20 +1,231 @@
-import requests
+import logging
+import os
+import threading
 import streamlit as st
 import json
-# Function to fetch stock data with caching - the decorator caches the function output
-@st.cache_data(ttl=3600)  # Cache data for 1 hour
-def get_stock_data(ticker="AAPL,MSFT,^SPX"):
-    url = "https://yahoo-finance15.p.rapidapi.com/api/v1/markets/stock/quotes"
+from typing import Callable, Dict, List, Optional, Tuple
+from api_client import default_client
+from disk_cache import SWRCache
 
-    querystring = {"ticker":ticker}
+logger = logging.getLogger(__name__)
 
+# Overridable so the client can be pointed at a local stub server
+QUOTES_URL = os.environ.get("QUOTES_API_URL", "https://yahoo-finance15.p.rapidapi.com/api/v1/markets/stock/quotes")
+QUOTE_TTL = 3600  # Cache each symbol for 1 hour
+QUOTE_BATCH_SIZE = 50  # symbols per quotes request (whole sectors can be selected)
+ABSENT_QUOTE_TTL = 300  # Remember symbols the API has no quote for (typos, delistings) for 5 minutes
+
+# ---------------------------------------------------
+# Per-symbol Quote Cache
+# ---------------------------------------------------
+class QuoteCache:
+    """Caches quotes per symbol and fetches only the missing ones in one batch.
+
+    Quotes are kept in a disk-backed ``SWRCache``, so they survive restarts
+    and are shared between processes. Expired quotes are served immediately
+    and refreshed in one background batch. Concurrent callers asking for a
+    symbol that is already being fetched wait for that request instead of
+    issuing their own. Symbols missing from a successful fetch are
+    remembered in ``absent`` for ``absent_ttl`` seconds and not requested
+    again until then; ``fetch`` must raise on a failed or malformed response.
+    """
+
+    def __init__(self, fetch: Callable[[List[str]], List[Dict]], ttl: float = QUOTE_TTL,
+                 wait_timeout: float = 30, store: Optional[SWRCache] = None,
+                 absent_ttl: float = ABSENT_QUOTE_TTL, absent: Optional[SWRCache] = None):
+        self._fetch = fetch
+        self.store = store or SWRCache("quotes", ttl=ttl)
+        # max_age: an expired "absent" mark is a miss, not something to serve stale
+        self.absent = absent or SWRCache("quotes_absent", ttl=absent_ttl, max_age=absent_ttl)
+        self.wait_timeout = wait_timeout
+        self._inflight = {}  # symbol -> threading.Event set when its fetch finishes
+        self._lock = threading.Lock()
+
+    def _claim(self, symbols: List[str]) -> Tuple[List[str], List[threading.Event]]:
+        """Split ``symbols`` into ones this caller fetches and fetches to wait on."""
+        to_fetch, to_wait = [], []
+        with self._lock:
+            for symbol in symbols:
+                if symbol in self._inflight:
+                    to_wait.append(self._inflight[symbol])
+                else:
+                    self._inflight[symbol] = threading.Event()
+                    to_fetch.append(symbol)
+        return to_fetch, to_wait
+
+    def _fetch_and_store(self, symbols: List[str]) -> None:
+        try:
+            quotes = self._fetch(symbols)
+            found = {str(q.get("symbol", "")).upper(): q for q in quotes}
+            self.store.set_many(found)
+            self.absent.set_many({symbol: True for symbol in symbols if symbol not in found})
+        finally:
+            with self._lock:
+                for symbol in symbols:
+                    self._inflight.pop(symbol).set()
+
+    def _refresh_in_background(self, symbols: List[str]) -> None:
+        to_fetch, _ = self._claim(symbols)
+        if not to_fetch:
+            return
+
+        def run():
+            try:
+                self._fetch_and_store(to_fetch)
+            except Exception as e:
+                logger.warning("Background quote refresh failed: %s", e)
+
+        threading.Thread(target=run, name="quote-refresh", daemon=True).start()
+
+    def get(self, symbols: List[str], max_age: Optional[float] = None) -> List[Dict]:
+        """Return quotes for ``symbols`` in the order requested.
+
+        ``max_age`` (seconds) lowers the refresh threshold below the TTL for
+        callers that poll, e.g. the live grid; older quotes are still served
+        while they refresh.
+        """
+        symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s.strip()))
+        refresh_after = self.store.ttl if max_age is None else min(max_age, self.store.ttl)
+        cached = self.store.get_many(symbols)
+        missing = [s for s in symbols if s not in cached]
+        if missing:
+            absent = self.absent.get_many(missing)
+            missing = [s for s in missing if s not in absent]
+        stale = [s for s in symbols if s in cached and cached[s][1] >= refresh_after]
+        if stale:
+            self._refresh_in_background(stale)
+
+        error = None
+        if missing:
+            to_fetch, to_wait = self._claim(missing)
+            if to_fetch:
+                try:
+                    self._fetch_and_store(to_fetch)
+                except Exception as e:
+                    error = e
+            for event in to_wait:
+                event.wait(self.wait_timeout)
+            # Read back without counting a second lookup of the same symbols
+            cached.update(self.store.get_many(missing, count=False))
+
+        found = [cached[s][0] for s in symbols if s in cached]
+        if error is not None and not found:
+            raise error
+        return found
+
+    def stats(self) -> Dict:
+        return {**self.store.stats(), "absent_hits": self.absent.counters["hits"]}
+
+
+def _fetch_quotes(symbols: List[str]) -> List[Dict]:
+    """Fetch quotes for several symbols, QUOTE_BATCH_SIZE per API call."""
     headers = {
         "x-rapidapi-key": st.secrets["rapidapi_key"],
         "x-rapidapi-host": "yahoo-finance15.p.rapidapi.com"
     }
+    quotes = []
+    for start in range(0, len(symbols), QUOTE_BATCH_SIZE):
+        batch = symbols[start:start + QUOTE_BATCH_SIZE]
+        response = default_client.get(QUOTES_URL, headers=headers, params={"ticker": ",".join(batch)})
+        # A quota/error response must not mark every symbol as absent
+        response.raise_for_status()
+        payload = response.json()
+        if not isinstance(payload, dict) or not isinstance(payload.get("body"), list):
+            raise ValueError(f"Unexpected quotes payload: {str(payload)[:200]}")
+        quotes.extend(payload["body"])
+    return quotes
+
+
+quote_cache = QuoteCache(_fetch_quotes)
 
-    response = requests.get(url, headers=headers, params=querystring)
-    return response.json()
+
+# Function to fetch stock data - quotes are cached per symbol by quote_cache
+def get_stock_data(ticker="AAPL,MSFT,^SPX", max_age=None):
+    return {"body": quote_cache.get(ticker.split(","), max_age=max_age)}
+
+
+# ---------------------------------------------------
+# Quote Grid
+# ---------------------------------------------------
+QUOTE_FIELDS = [
+    ("longName", "Company Name", ""),
+    ("regularMarketPrice", "Current Price", "$"),
+    ("regularMarketDayHigh", "Today's High", "$"),
+    ("regularMarketDayLow", "Today's Low", "$"),
+    ("fiftyTwoWeekRange", "52-Week Range", ""),
+]
+SNAPSHOT_KEY = "quote_grid_snapshot"
+LIVE_INTERVALS = [5, 15, 30, 60]  # seconds
+
+# st.fragment reruns only the decorated function; older releases call it experimental_fragment
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+
+def diff_quotes(quotes: List[Dict], snapshot: Dict[str, Dict]) -> Dict[str, set]:
+    """Return {symbol: fields whose value differs from ``snapshot``} (new symbols: no fields)."""
+    changed = {}
+    for quote in quotes:
+        previous = snapshot.get(quote.get("symbol"))
+        if previous is None:
+            changed[quote.get("symbol")] = set()
+        else:
+            changed[quote.get("symbol")] = {f for f, _, _ in QUOTE_FIELDS if quote.get(f) != previous.get(f)}
+    return changed
+
+
+def _quote_cell(quote: Dict, changed: set, previous: Optional[Dict]) -> str:
+    """One grid cell as a single markdown element."""
+    lines = [f"##### **{quote.get('symbol')}**"]
+    for field, label, prefix in QUOTE_FIELDS:
+        value = quote.get(field)
+        text = f"**{label}:** {prefix}{value}"
+        if field in changed:
+            color = "gray"
+            try:
+                color = "green" if float(value) > float(previous.get(field)) else "red"
+            except (TypeError, ValueError):
+                pass
+            text = f"<span style='background-color:{color};color:white;padding:0 4px'>{text}</span>"
+        lines.append(f"<small>{text}</small>")
+    return "<br>".join(lines)
+
+
+def render_quote_grid(tickers: str, max_age: Optional[float] = None, num_columns: int = 4) -> None:
+    """Draw the quote grid, highlighting values changed since the last draw in this session."""
+    try:
+        quotes = get_stock_data(tickers, max_age=max_age).get("body", [])
+    except Exception as e:
+        st.error(f"Could not load quotes: {e}")
+        return
+
+    snapshot = st.session_state.get(SNAPSHOT_KEY, {})
+    changed = diff_quotes(quotes, snapshot)
+    columns = st.columns(num_columns)
+    for i, quote in enumerate(quotes):
+        with columns[i % num_columns]:
+            symbol = quote.get("symbol")
+            st.markdown(_quote_cell(quote, changed.get(symbol, set()), snapshot.get(symbol)),
+                        unsafe_allow_html=True)
+            st.write("---")
+
+    st.session_state[SNAPSHOT_KEY] = {q.get("symbol"): {f: q.get(f) for f, _, _ in QUOTE_FIELDS} for q in quotes}
+    updated = sum(1 for fields in changed.values() if fields)
+    st.caption(f"{len(quotes)} quotes · {updated} changed since last update")
+
+
+def render_live_quotes(tickers: str) -> None:
+    """Quote grid with an optional live mode that reruns only the grid on an interval."""
+    live = st.checkbox("🔴 Live quotes", value=False, key="live_quotes", disabled=_fragment is None,
+                       help=None if _fragment else "Requires a Streamlit release with st.fragment")
+    if not live:
+        render_quote_grid(tickers)
+        return
+
+    interval = st.select_slider("Refresh every (seconds)", options=LIVE_INTERVALS, value=15,
+                                key="live_quotes_interval")
+    # Only this function reruns on each tick; the rest of the page is left alone.
+    # Quotes older than the interval are refreshed once for all viewers.
+    _fragment(run_every=interval)(render_quote_grid)(tickers, max_age=interval)
 
 # Example usage
 if __name__ == "__main__":
@@ -30,4 +241,4 @@ if __name__ == "__main__":
         print(f"  Today's High: ${stock['regularMarketDayHigh']}")
         print(f"  Today's Low: ${stock['regularMarketDayLow']}")
         print(f"  52-Week Range: {stock['fiftyTwoWeekRange']}")
-        
\ No newline at end of file
+
@@ -0,0 +1,152 @@
+import csv
+import os
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SP500_PATH = os.path.join(DATA_DIR, "sp500.csv")
+EXTRA_TICKERS_PATH = os.path.join(DATA_DIR, "extra_tickers.csv")
+
+# Extra CSV files (same columns), separated by os.pathsep
+EXTRA_TICKERS_ENV = "QUICK_TOOLS_EXTRA_TICKERS"
+
+
+# ---------------------------------------------------
+# Ticker Universe Class
+# ---------------------------------------------------
+class TickerUniverse:
+    """Read-only, searchable index of ticker symbols with name, sector and exchange.
+
+    Symbols are kept sorted, so prefix search is a bisect. Company-name words
+    are kept in a second sorted list for name-prefix search. Substring search
+    scans one pre-lowered string. Every column is a plain list indexed by row;
+    sector and exchange strings are shared between rows.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, str]]):
+        by_symbol = {}
+        for row in rows:
+            symbol = (row.get("Symbol") or "").strip().upper()
+            if symbol and symbol not in by_symbol:  # first source wins
+                by_symbol[symbol] = row
+
+        self.symbols: List[str] = sorted(by_symbol)
+        self.names: List[str] = []
+        self.sectors: List[str] = []
+        self.exchanges: List[str] = []
+        self.sources: List[str] = []
+        self._index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._by_sector: Dict[str, List[int]] = {}
+        interned: Dict[str, str] = {}
+        words = []
+        for i, symbol in enumerate(self.symbols):
+            row = by_symbol[symbol]
+            name = (row.get("Name") or "").strip()
+            sector = interned.setdefault(row.get("Sector") or "", row.get("Sector") or "")
+            self.names.append(name)
+            self.sectors.append(sector)
+            self.exchanges.append(interned.setdefault(row.get("Exchange") or "", row.get("Exchange") or ""))
+            self.sources.append(interned.setdefault(row.get("_source", ""), row.get("_source", "")))
+            self._by_sector.setdefault(sector, []).append(i)
+            words.extend((word, i) for word in set(name.lower().replace(",", " ").split()))
+        words.sort()
+        self._name_words = [word for word, _ in words]
+        self._name_rows = [i for _, i in words]
+        # "symbol name" lines; a match position maps back to its row through _offsets
+        lines = [f"{symbol} {name}".lower() for symbol, name in zip(self.symbols, self.names)]
+        self._text = "\n".join(lines)
+        self._offsets = []
+        position = 0
+        for line in lines:
+            self._offsets.append(position)
+            position += len(line) + 1
+
+    @classmethod
+    def from_csv(cls, paths: Sequence[str]) -> "TickerUniverse":
+        """Load Symbol/Name/Sector/Exchange CSV files; earlier files win on duplicates."""
+        rows = []
+        for path in paths:
+            source = os.path.splitext(os.path.basename(path))[0]
+            with open(path, newline="", encoding="utf-8") as f:
+                rows.extend({**row, "_source": source} for row in csv.DictReader(f))
+        return cls(rows)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol.upper() in self._index
+
+    def get(self, symbol: str) -> Optional[Dict[str, str]]:
+        i = self._index.get(symbol.upper())
+        if i is None:
+            return None
+        return {"Symbol": self.symbols[i], "Name": self.names[i], "Sector": self.sectors[i],
+                "Exchange": self.exchanges[i]}
+
+    def label(self, symbol: str) -> str:
+        """``"AAPL — Apple Inc."`` for display (the symbol alone if unknown)."""
+        i = self._index.get(symbol.upper())
+        return symbol if i is None else f"{symbol} — {self.names[i]}"
+
+    @property
+    def sector_names(self) -> List[str]:
+        return sorted(s for s in self._by_sector if s)
+
+    def in_sector(self, sector: str) -> List[str]:
+        return [self.symbols[i] for i in self._by_sector.get(sector, [])]
+
+    def from_source(self, source: str) -> List[str]:
+        """Symbols loaded from one file, e.g. ``"sp500"``."""
+        return [symbol for symbol, s in zip(self.symbols, self.sources) if s == source]
+
+    def prefix(self, query: str, limit: int = 50) -> List[str]:
+        """Symbols starting with ``query``, then symbols whose company name has a word starting with it."""
+        query = query.strip()
+        if not query:
+            return []
+        found = []
+        upper = query.upper()
+        i = bisect_left(self.symbols, upper)
+        while i < len(self.symbols) and self.symbols[i].startswith(upper) and len(found) < limit:
+            found.append(self.symbols[i])
+            i += 1
+
+        lower = query.lower()
+        seen = set(found)
+        i = bisect_left(self._name_words, lower)
+        while i < len(self._name_words) and self._name_words[i].startswith(lower) and len(found) < limit:
+            symbol = self.symbols[self._name_rows[i]]
+            if symbol not in seen:
+                seen.add(symbol)
+                found.append(symbol)
+            i += 1
+        return found
+
+    def search(self, query: str, limit: int = 50) -> List[str]:
+        """Prefix matches first, then any symbol or name containing ``query``."""
+        found = self.prefix(query, limit)
+        lower = query.strip().lower()
+        if not lower or len(found) >= limit:
+            return found
+        seen = set(found)
+        position = self._text.find(lower)
+        while position != -1 and len(found) < limit:
+            row = bisect_left(self._offsets, position + 1) - 1
+            symbol = self.symbols[row]
+            if symbol not in seen:
+                seen.add(symbol)
+                found.append(symbol)
+            # Continue after this line
+            next_line = self._offsets[row + 1] if row + 1 < len(self._offsets) else len(self._text)
+            position = self._text.find(lower, next_line)
+        return found
+
+
+@lru_cache(maxsize=1)
+def get_universe() -> TickerUniverse:
+    """The packaged universe (S&P 500 plus extra tickers), loaded once per process."""
+    paths = [SP500_PATH, EXTRA_TICKERS_PATH]
+    paths += [p for p in os.environ.get(EXTRA_TICKERS_ENV, "").split(os.pathsep) if p]
+    return TickerUniverse.from_csv(paths)
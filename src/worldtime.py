@@ -1,6 +1,21 @@
-from datetime import datetime
+import html
+import json
+from bisect import bisect_left
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import pytz
 
+TIME_FORMAT = "%I:%M:%S %p"   # wall‑clock style (HH:MM:SS AM/PM)
+DATE_FORMAT = "%A, %d %B %Y"
+
+
+@lru_cache(maxsize=None)
+def get_zone(name: str):
+    """Resolve a zone once per process; ``pytz.timezone`` re-reads tzdata otherwise."""
+    return pytz.timezone(name)
+
+
 # ---------------------------------------------------
 # OOP Class for Timezone Handling
 # ---------------------------------------------------
@@ -9,12 +24,127 @@ class CountryTime:
         self.country_name = country_name
         self.timezone = timezone
 
-    def get_current_time(self):
-        tz = pytz.timezone(self.timezone)
-        now = datetime.now(tz)
-        return now.strftime("%I:%M:%S %p")   # wall‑clock style (HH:MM:SS AM/PM)
+    def localize(self, now: Optional[datetime] = None) -> datetime:
+        """``now`` (an aware instant, default: the current time) in this zone."""
+        now = now or datetime.now(pytz.utc)
+        return now.astimezone(get_zone(self.timezone))
+
+    def get_current_time(self, now: Optional[datetime] = None):
+        return self.localize(now).strftime(TIME_FORMAT)
+
+    def get_current_date(self, now: Optional[datetime] = None):
+        return self.localize(now).strftime(DATE_FORMAT)
+
+
+# ---------------------------------------------------
+# World Clock Class
+# ---------------------------------------------------
+class WorldClock:
+    """Converts one UTC instant into every configured zone at once.
+
+    Time and date for a zone always come from the same instant, and zone
+    objects are resolved once per process. ``search_zones`` searches the
+    full IANA list by prefix of the zone or city name, then by substring.
+    """
+
+    def __init__(self, clocks: List[CountryTime]):
+        self.clocks = list(clocks)
+
+    def snapshot(self, now: Optional[datetime] = None) -> List[Dict]:
+        """Name, zone, time, date and UTC offset of every clock at one instant."""
+        now = now or datetime.now(timezone.utc)
+        rows = []
+        for clock in self.clocks:
+            local = clock.localize(now)
+            rows.append({
+                "name": clock.country_name,
+                "timezone": clock.timezone,
+                "time": local.strftime(TIME_FORMAT),
+                "date": local.strftime(DATE_FORMAT),
+                "utc_offset": local.strftime("%z"),
+            })
+        return rows
+
+    @staticmethod
+    def search_zones(query: str, limit: int = 20) -> List[str]:
+        """IANA zones matching ``query``: prefix matches first, then substring matches."""
+        keys, zones = _zone_index()
+        query = query.strip().lower().replace(" ", "_")
+        if not query:
+            return []
+
+        found = []
+        i = bisect_left(keys, query)
+        while i < len(keys) and keys[i].startswith(query) and len(found) < limit:
+            if zones[i] not in found:
+                found.append(zones[i])
+            i += 1
+        if len(found) < limit:
+            for zone in pytz.all_timezones:
+                if query in zone.lower() and zone not in found:
+                    found.append(zone)
+                    if len(found) == limit:
+                        break
+        return found
+
+
+@lru_cache(maxsize=1)
+def _zone_index() -> Tuple[List[str], List[str]]:
+    """Sorted search keys (full zone name and city part, lower-case) and their zones."""
+    entries = set()
+    for zone in pytz.all_timezones:
+        entries.add((zone.lower(), zone))
+        entries.add((zone.rsplit("/", 1)[-1].lower(), zone))
+    ordered = sorted(entries)
+    return [key for key, _ in ordered], [zone for _, zone in ordered]
+
+
+def clock_grid_html(snapshot: List[Dict], columns: int = 4) -> str:
+    """A self-contained clock grid that ticks in the browser.
 
-    def get_current_date(self):
-        tz = pytz.timezone(self.timezone)
-        now = datetime.now(tz)
-        return now.strftime("%A, %d %B %Y")
\ No newline at end of file
+    The server-rendered ``snapshot`` is shown first; a small script then
+    updates every clock each second with ``Intl.DateTimeFormat``, so no
+    server round trip is needed to keep the clocks running.
+    """
+    cells = "".join(
+        f"""<div class="clock" data-tz="{html.escape(row['timezone'])}">
+              <h3>{html.escape(row['name'])}</h3>
+              <div class="time">{row['time']}</div>
+              <div class="date">{row['date']}</div>
+              <hr>
+            </div>"""
+        for row in snapshot
+    )
+    zones = json.dumps(sorted({row["timezone"] for row in snapshot}))
+    return f"""
+    <style>
+      body {{ font-family: "Source Sans Pro", sans-serif; margin: 0; }}
+      .grid {{ display: grid; grid-template-columns: repeat({columns}, 1fr); gap: 1rem; }}
+      .clock h3 {{ margin: 0.5rem 0; }}
+      .time {{ font-size: 48px; font-weight: bold; }}
+      .date {{ font-size: 18px; color: gray; }}
+    </style>
+    <div class="grid">{cells}</div>
+    <script>
+      const formats = {{}};
+      for (const zone of {zones}) {{
+        formats[zone] = {{
+          time: new Intl.DateTimeFormat("en-US", {{timeZone: zone, hour: "2-digit", minute: "2-digit",
+                                                  second: "2-digit", hour12: true}}),
+          date: new Intl.DateTimeFormat("en-GB", {{timeZone: zone, weekday: "long", day: "2-digit",
+                                                  month: "long", year: "numeric"}}),
+        }};
+      }}
+      function tick() {{
+        const now = new Date();  // one instant for every clock
+        for (const el of document.querySelectorAll(".clock")) {{
+          const f = formats[el.dataset.tz];
+          const d = Object.fromEntries(f.date.formatToParts(now).map(p => [p.type, p.value]));
+          el.querySelector(".time").textContent = f.time.format(now);
+          el.querySelector(".date").textContent = `${{d.weekday}}, ${{d.day}} ${{d.month}} ${{d.year}}`;
+        }}
+      }}
+      tick();
+      setInterval(tick, 1000);
+    </script>
+    """
@@ -0,0 +1,118 @@
+import time
+
+import pytest
+import requests
+
+from api_client import APIClient, APIError, CircuitBreaker, CircuitOpenError
+
+
+def make_client(**kwargs) -> APIClient:
+    options = {"rate": 100, "burst": 10, "backoff": 0.01, "max_backoff": 0.05, "timeout": 2, "deadline": 5}
+    options.update(kwargs)
+    return APIClient(**options)
+
+
+def test_429_retry_after_pauses_the_bucket(stub):
+    stub.respond((429, {"Retry-After": "0.3"}, 0), (200, {}, 0))
+    client = make_client()
+
+    response = client.get(stub.url)
+
+    assert response.status_code == 200
+    assert len(stub.calls) == 2
+    assert stub.calls[1] - stub.calls[0] >= 0.29
+    # The pause applies to every caller of the host, not just the one retrying
+    assert client.bucket(stub.host)._paused_until > 0
+    # A quota response is not an outage
+    assert client.stats()[stub.host] == {"state": "closed", "failures": 0}
+
+
+def test_retries_stop_at_max_retries(stub):
+    stub.respond((503, {}, 0))
+    client = make_client(max_retries=2, failure_threshold=10)
+
+    response = client.get(stub.url)
+
+    assert response.status_code == 503
+    assert len(stub.calls) == 3
+
+
+def test_retry_after_beyond_the_deadline_returns_early(stub):
+    stub.respond((429, {"Retry-After": "10"}, 0))
+    client = make_client(max_retries=5, deadline=1)
+
+    started = time.monotonic()
+    response = client.get(stub.url)
+
+    assert response.status_code == 429
+    assert len(stub.calls) == 1
+    assert time.monotonic() - started < 1
+
+
+def test_timeouts_are_retried_then_raise(stub):
+    stub.respond((200, {}, 0.5))
+    client = make_client(max_retries=1, timeout=0.1, failure_threshold=10)
+
+    with pytest.raises(APIError) as excinfo:
+        client.get(stub.url)
+
+    assert isinstance(excinfo.value.__cause__, requests.Timeout)
+    assert len(stub.calls) == 2
+    assert client.breaker(stub.host).failures == 2
+
+
+def test_breaker_opens_half_opens_and_closes(stub):
+    stub.respond((500, {}, 0))
+    client = make_client(max_retries=0, failure_threshold=2, reset_timeout=0.3)
+
+    assert client.get(stub.url).status_code == 500
+    assert client.stats()[stub.host]["state"] == CircuitBreaker.CLOSED
+    assert client.get(stub.url).status_code == 500
+    assert client.stats()[stub.host]["state"] == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        client.get(stub.url)
+    assert len(stub.calls) == 2  # failed fast without calling the host
+
+    time.sleep(0.35)
+    breaker = client.breaker(stub.host)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()  # only one trial at a time
+    breaker.record_success()
+
+    stub.respond((200, {}, 0))
+    assert client.get(stub.url).status_code == 200
+    assert client.stats()[stub.host] == {"state": "closed", "failures": 0}
+
+
+def test_failed_half_open_trial_reopens_the_circuit(stub):
+    stub.respond((500, {}, 0))
+    client = make_client(max_retries=0, failure_threshold=1, reset_timeout=0.2)
+    client.get(stub.url)
+    time.sleep(0.25)
+
+    assert client.get(stub.url).status_code == 500
+    assert client.stats()[stub.host]["state"] == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        client.get(stub.url)
+
+
+def test_unexpected_error_in_half_open_trial_does_not_block_the_host(stub):
+    stub.respond((500, {}, 0))
+    client = make_client(max_retries=0, failure_threshold=1, reset_timeout=0.2)
+    client.session.max_redirects = 2
+    client.get(stub.url)
+    time.sleep(0.25)
+
+    # Neither a ConnectionError nor a Timeout, and not retried
+    stub.respond((302, {"Location": "/"}, 0))
+    with pytest.raises(requests.TooManyRedirects):
+        client.get(stub.url)
+    assert client.stats()[stub.host]["state"] == CircuitBreaker.OPEN
+
+    # The next trial after the reset timeout is let through again
+    time.sleep(0.25)
+    stub.respond((200, {}, 0))
+    assert client.get(stub.url).status_code == 200
+    assert client.stats()[stub.host]["state"] == CircuitBreaker.CLOSED
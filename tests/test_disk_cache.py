@@ -0,0 +1,60 @@
+import threading
+import time
+
+import pytest
+
+from disk_cache import SWRCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SWRCache("test", ttl=60, path=str(tmp_path / "cache.sqlite"))
+
+
+def get_concurrently(cache: SWRCache, key: str, fetch, threads: int = 5):
+    results, errors = [], []
+
+    def run():
+        try:
+            results.append(cache.get(key, fetch))
+        except Exception as e:
+            errors.append(e)
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return results, errors
+
+
+def test_concurrent_misses_share_one_fetch(cache):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"value": 1}
+
+    results, errors = get_concurrently(cache, "key", fetch)
+
+    assert len(calls) == 1
+    assert results == [{"value": 1}] * 5
+    assert not errors
+
+
+def test_waiters_get_the_fetch_error(cache):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        raise RuntimeError("upstream down")
+
+    results, errors = get_concurrently(cache, "key", fetch)
+
+    assert len(calls) == 1
+    assert not results
+    assert [str(e) for e in errors] == ["upstream down"] * 5
+    # The next miss fetches again
+    assert cache.get("key", lambda: {"value": 2}) == {"value": 2}
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+import stocks
+from api_client import APIClient
+from disk_cache import SWRCache
+from stocks import QuoteCache
+
+
+@pytest.fixture
+def quotes_api(stub, monkeypatch, tmp_path):
+    """QuoteCache using the real _fetch_quotes against the stub server, with its own cache file."""
+    monkeypatch.setattr(stocks, "QUOTES_URL", stub.url)
+    monkeypatch.setattr(stocks.st, "secrets", {"rapidapi_key": "test"})
+    monkeypatch.setattr(stocks, "default_client",
+                        APIClient(rate=100, burst=10, max_retries=3, backoff=0.01, max_backoff=0.02, timeout=2))
+    path = str(tmp_path / "cache.sqlite")
+    cache = QuoteCache(stocks._fetch_quotes, store=SWRCache("quotes", 60, path=path),
+                       absent=SWRCache("quotes_absent", 60, path=path, max_age=60))
+    return stub, cache
+
+
+def body(*symbols) -> bytes:
+    return json.dumps({"body": [{"symbol": s, "regularMarketPrice": 1.0} for s in symbols]}).encode()
+
+
+def test_unknown_symbols_are_not_requested_again(quotes_api):
+    stub, cache = quotes_api
+    stub.respond((200, {}, 0, body("AAPL")))
+
+    assert [q["symbol"] for q in cache.get(["AAPL", "ZZZZ"])] == ["AAPL"]
+    assert [q["symbol"] for q in cache.get(["AAPL", "ZZZZ"])] == ["AAPL"]
+    assert len(stub.calls) == 1
+
+
+def test_error_responses_do_not_mark_symbols_absent(quotes_api):
+    stub, cache = quotes_api
+    stub.respond(*[(429, {}, 0, b'{"message": "Too many requests"}')] * 4, (200, {}, 0, body("AAPL")))
+
+    with pytest.raises(Exception):
+        cache.get(["AAPL"])
+    assert len(stub.calls) == 4  # retries ran out on the 429s
+
+    assert [q["symbol"] for q in cache.get(["AAPL"])] == ["AAPL"]
+    assert len(stub.calls) == 5
+
+
+def test_payload_without_body_is_an_error(quotes_api):
+    stub, cache = quotes_api
+    stub.respond((200, {}, 0, b'{"message": "You are not subscribed to this API."}'), (200, {}, 0, body("AAPL")))
+
+    with pytest.raises(ValueError):
+        cache.get(["AAPL"])
+    assert [q["symbol"] for q in cache.get(["AAPL"])] == ["AAPL"]
@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from cnvt_image_drawing import _halo, _preprocess, _preprocess_tiled, _tiles
+
+
+@pytest.mark.parametrize("blur_ksize", [1, 3, 5, 9, 15])
+@pytest.mark.parametrize("shape", [(300, 513), (300, 517), (300, 519), (300, 521), (517, 300), (263, 263)])
+@pytest.mark.parametrize("tile_size", [128, 256])
+def test_tiled_preprocess_matches_full_frame(blur_ksize, shape, tile_size):
+    gray = np.random.default_rng(0).integers(0, 256, shape, dtype=np.uint8)
+
+    full = _preprocess(gray, blur_ksize, 75, 75)
+    tiled = _preprocess_tiled(gray, blur_ksize, 75, 75, tile_size, workers=4)
+
+    assert np.array_equal(full, tiled)
+
+
+def test_narrow_last_tiles_are_merged():
+    halo = _halo(9)
+    tiles = _tiles(300, 517, 256, min_last=2 * halo)
+
+    assert sorted({(x0, x1) for _, _, x0, x1 in tiles}) == [(0, 256), (256, 517)]
+    assert sorted({(y0, y1) for y0, y1, _, _ in tiles}) == [(0, 256), (256, 300)]